@@ -1,3 +1,4 @@
+import os
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -5,13 +6,15 @@ from typing import (
     Generic,
     List,
     Optional,
+    Sequence,
+    Tuple,
     Type,
 )
 
 from sqlalchemy import delete, exists, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.inspection import inspect as inspect_model
-from sqlalchemy.orm import load_only, selectinload
+from sqlalchemy.orm import load_only, raiseload, selectinload
 from sqlalchemy.sql import Select
 
 from ..errors import ValidationError
@@ -46,6 +49,12 @@ class CRUDHooks(
     allowing you to implement custom business logic, validation, and
     side effects.
 
+    The pre/post hooks of create, update and delete run inside the
+    transaction of the operation: post hooks are called after the changes are
+    flushed but before BaseCRUD commits, so hooks should only add to the
+    session (or ``flush()`` when they need generated values) and must not
+    commit themselves.
+
     Example:
         ```python
         class UserHooks(CRUDHooks[User, int, UserCreate, UserUpdate]):
@@ -86,7 +95,7 @@ class CRUDHooks(
     async def post_create(
         self, db_session: AsyncSession, obj: ModelType, *args, **kwargs
     ) -> ModelType:
-        """Called after creating an object.
+        """Called after creating an object, before the transaction is committed.
 
         Args:
             db_session: Database session
@@ -139,7 +148,7 @@ class CRUDHooks(
     async def post_update(
         self, db_session: AsyncSession, obj: ModelType, *args, **kwargs
     ) -> ModelType:
-        """Called after updating an object.
+        """Called after updating an object, before the transaction is committed.
 
         Args:
             db_session: Database session
@@ -186,7 +195,7 @@ class CRUDHooks(
     async def post_delete(
         self, db_session: AsyncSession, obj: ModelType, *args, **kwargs
     ) -> ModelType:
-        """Called after deleting an object.
+        """Called after deleting an object, before the transaction is committed.
 
         Args:
             db_session: Database session
@@ -268,6 +277,9 @@ class BaseCRUD(Generic[ModelType, PrimaryKeyType, CreateSchemaType, UpdateSchema
     Args:
         model: SQLAlchemy model class
         hooks: Optional CRUDHooks instance for lifecycle callbacks
+        strict_loading: Make relations that were not prefetched raise instead of
+            lazy loading on objects returned by ``list_objects``. Defaults to the
+            ``CRUD_STRICT_LOADING`` environment variable.
 
     Example:
         ```python
@@ -281,15 +293,22 @@ class BaseCRUD(Generic[ModelType, PrimaryKeyType, CreateSchemaType, UpdateSchema
         self,
         model: Type[ModelType],
         hooks: Optional[CRUDHooks] = None,
+        strict_loading: Optional[bool] = None,
     ):
         """Initialize the BaseCRUD instance.
 
         Args:
             model: SQLAlchemy model class to operate on
             hooks: Optional CRUDHooks instance for lifecycle callbacks
+            strict_loading: Raise on lazy loads of relations missing from ``prefetch``
+                in ``list_objects``; ``None`` reads ``CRUD_STRICT_LOADING``
         """
         self.model = model
         self.hooks = hooks or CRUDHooks()
+        if strict_loading is None:
+            strict_loading = os.getenv("CRUD_STRICT_LOADING", "0") == "1"
+        self.strict_loading = strict_loading
+        self._loader_cache: Dict[Tuple[str, ...], List] = {}
         self.query_filter = QueryFilter(model)
 
     @property
@@ -323,16 +342,20 @@ class BaseCRUD(Generic[ModelType, PrimaryKeyType, CreateSchemaType, UpdateSchema
             ```
         """
         pk_values = id if isinstance(id, tuple) else (id,)
+        obj = await self.hooks.pre_read(session, id)
+
+        if not prefetch:
+            # Without relations to load, the session's identity map can answer
+            # for objects this session already holds, skipping the SELECT.
+            obj = await session.get(self.model, pk_values)
+            return await self.hooks.post_read(session, obj)
+
         pk_conditions = [
             getattr(self.model, pk_col) == val
             for pk_col, val in zip(self.pk, pk_values, strict=False)
         ]  # TODO: Check order of pk_values
-        query = select(self.model).where(*pk_conditions)
+        query = self._apply_prefetch(select(self.model).where(*pk_conditions), prefetch)
 
-        if prefetch:
-            query = self._apply_prefetch(query, prefetch)
-
-        obj = await self.hooks.pre_read(session, id)
         result = await session.execute(query)
         obj = await self.hooks.post_read(session, result.scalar_one_or_none())
         return obj
@@ -383,19 +406,28 @@ class BaseCRUD(Generic[ModelType, PrimaryKeyType, CreateSchemaType, UpdateSchema
         page = pagination["page"]
         size = pagination["size"]
 
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await db.execute(count_query)).scalar() or 0
+        offset = (page - 1) * size
+
+        # The total rides along as a COUNT(*) OVER () column, so a page costs one
+        # round-trip. A page past the end has no rows to carry it and falls back
+        # to a separate count.
+        paged_query = (
+            query.add_columns(func.count().over().label("_total")).offset(offset).limit(size)
+        )
+        rows = (await db.execute(paged_query)).unique().all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0][-1]
+        elif offset:
+            count_query = select(func.count()).select_from(query.subquery())
+            total = (await db.execute(count_query)).scalar() or 0
+        else:
+            total = 0
+
         total_pages = max(
             (total + size - 1) // size,
             1,
         )
-
-        offset = (page - 1) * size
-
-        query = query.offset(offset).limit(size)
-
-        result = await db.execute(query)
-        items = list(result.scalars().unique().all())
         return PaginatedResponse(
             items=items,
             total=total,
@@ -411,7 +443,7 @@ class BaseCRUD(Generic[ModelType, PrimaryKeyType, CreateSchemaType, UpdateSchema
         session: AsyncSession,
         *,
         search: Optional[str] = None,
-        search_fields: Optional[List[str]] = None,
+        search_fields: Optional[Sequence[str]] = None,
         sorting: str | None = None,
         filters: List[FilterParam] | None = None,
         prefetch: List[str] | None = None,
@@ -435,9 +467,12 @@ class BaseCRUD(Generic[ModelType, PrimaryKeyType, CreateSchemaType, UpdateSchema
         query = select(self.model)
         if prefetch:
             query = self._apply_prefetch(query, prefetch)
+        if self.strict_loading:
+            # Every row would otherwise lazy load its relations one SELECT at a time
+            query = query.options(raiseload("*", sql_only=True))
 
         if search:
-            query = self.query_filter.apply_search(query, search, search_fields or [])
+            query = self.query_filter.apply_search(query, search, search_fields or ())
 
         if filters:
             query = self.query_filter.apply_filters(query, filters)
@@ -464,11 +499,15 @@ class BaseCRUD(Generic[ModelType, PrimaryKeyType, CreateSchemaType, UpdateSchema
         db_obj = self.model(**obj_data, **kwargs)
         db_obj = await self.hooks.pre_create(session, db_obj, obj_in)
         session.add(db_obj)
+        await session.flush()
+
+        # post hooks run inside the same transaction, so their writes are
+        # committed together with the object itself
+        db_obj = await self.hooks.post_create(session, db_obj)
         if commit:
             await session.commit()
             await session.refresh(db_obj, attribute_names=prefetch)
 
-        db_obj = await self.hooks.post_create(session, db_obj)
         return db_obj
 
     async def update(
@@ -487,18 +526,24 @@ class BaseCRUD(Generic[ModelType, PrimaryKeyType, CreateSchemaType, UpdateSchema
 
         obj = await self.hooks.pre_update(session, obj, obj_in)
         session.add(obj)
+        await session.flush()
+        obj = await self.hooks.post_update(session, obj)
         if commit:
             await session.commit()
-            await session.refresh(obj)
-        obj = await self.hooks.post_update(session, obj)
+            # Only reload what the commit (or server-side defaults) expired; with
+            # expire_on_commit=False the values just written are still current
+            expired = inspect_model(obj).expired_attributes
+            if expired:
+                await session.refresh(obj, attribute_names=list(expired))
         return obj
 
     async def delete(self, session: AsyncSession, obj: ModelType) -> ModelType:
         if not await self.hooks.pre_delete(session, obj):
             raise ValidationError("Delete operation cancelled by pre-delete hook")
         await session.delete(obj)
-        await session.commit()
+        await session.flush()
         obj = await self.hooks.post_delete(session, obj)
+        await session.commit()
         return obj
 
     async def delete_by_id(self, session: AsyncSession, id: PrimaryKeyType) -> int:
@@ -579,6 +624,9 @@ class BaseCRUD(Generic[ModelType, PrimaryKeyType, CreateSchemaType, UpdateSchema
         commit: bool = True,
         **kwargs,
     ) -> List[ModelType]:
+        if not objects:
+            return []
+
         db_objects = []
         for obj_in in objects:
             obj_data = obj_in.model_dump() if not isinstance(obj_in, dict) else obj_in
@@ -640,10 +688,16 @@ class BaseCRUD(Generic[ModelType, PrimaryKeyType, CreateSchemaType, UpdateSchema
         return result.rowcount
 
     def _apply_prefetch(self, query: Select, prefetch: List[str]) -> Select:
-        relations = self._get_model_relations(prefetch)
-        if not relations:
+        # Prefetch lists are fixed per endpoint, so validate and build the
+        # loader options once per distinct list instead of on every call
+        key = tuple(prefetch)
+        loaders = self._loader_cache.get(key)
+        if loaders is None:
+            relations = self._get_model_relations(prefetch)
+            loaders = self._build_relation_loaders(relations) if relations else []
+            self._loader_cache[key] = loaders
+        if not loaders:
             return query
-        loaders = self._build_relation_loaders(relations)
         return query.options(*loaders)
 
     def _get_model_relations(self, relations: List[str] | None = None) -> List[str]:
@@ -9,6 +9,7 @@ from typing import (
     Generic,
     List,
     Optional,
+    Sequence,
     Set,
     Type,
     Union,
@@ -31,6 +32,7 @@ from sqlalchemy import (
     not_,
     or_,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.sql.elements import BinaryExpression
 
@@ -580,7 +582,9 @@ class QueryFilter(Generic[ModelType]):
             )
         ]
 
-    def apply_search(self, query: "Select", search: str, search_fields: List[str]) -> "Select":
+    def apply_search(
+        self, query: "Select", search: str, search_fields: Sequence[str]
+    ) -> "Select":
         if not search:
             return query
 
@@ -593,7 +597,13 @@ class QueryFilter(Generic[ModelType]):
         conditions = []
         for field in search_fields:
             column = getattr(self.model, field, None)
-            if column is not None and hasattr(column, "ilike"):
+            if column is None or not hasattr(column, "ilike"):
+                continue
+            if isinstance(getattr(column, "type", None), TSVECTOR):
+                # Full-text match, which a GIN index on the vector can serve;
+                # renders as ``column @@ plainto_tsquery(search)`` on PostgreSQL
+                conditions.append(column.match(search))
+            else:
                 conditions.append(column.ilike(f"%{search}%"))
 
         if conditions:
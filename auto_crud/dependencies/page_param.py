@@ -18,6 +18,34 @@ from ..core.schemas.pagination import (
     # QueryParams,
 )
 
+# Every accepted operator spelling mapped to its canonical name, built once at
+# import so each parsed filter costs a single dict lookup
+_OPERATORS: Dict[str, str] = {
+    op: op
+    for op in (
+        "eq",
+        "ne",
+        "gt",
+        "ge",
+        "lt",
+        "le",
+        "in",
+        "not_in",
+        "is_null",
+        "is_not_null",
+        "between",
+        "contains",
+        "startswith",
+        "endswith",
+    )
+}
+_OPERATORS.update({"gte": "ge", "lte": "le", "==": "eq", "!=": "ne"})
+
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?\d+\.\d+")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}T[\d:]+(?:\.\d+)?Z?")
+
 
 class PageParams:
     """
@@ -130,31 +158,6 @@ class PageParams:
         if not filters_str:
             return []
 
-        # Define canonical operators and aliases
-        canonical_ops = {
-            "eq",
-            "ne",
-            "gt",
-            "ge",
-            "lt",
-            "le",
-            "in",
-            "not_in",
-            "is_null",
-            "is_not_null",
-            "between",
-            "contains",
-            "startswith",
-            "endswith",
-        }
-
-        alias_map = {
-            "gte": "ge",
-            "lte": "le",
-            "==": "eq",
-            "!=": "ne",
-        }
-
         def _coerce_scalar(raw: str) -> Any:
             """
             Coerce a string value to the appropriate Python type.
@@ -174,15 +177,15 @@ class PageParams:
                 return None
             if raw_l in {"true", "false"}:
                 return raw_l == "true"
-            if re.fullmatch(r"^-?\d+$", raw):
+            if _INT_RE.fullmatch(raw):
                 return int(raw)
-            if re.fullmatch(r"^-?\d+\.\d+$", raw):
+            if _FLOAT_RE.fullmatch(raw):
                 return float(raw)
 
             try:
-                if re.fullmatch(r"\d{4}-\d{2}-\d{2}", raw):
+                if _DATE_RE.fullmatch(raw):
                     return date.fromisoformat(raw)
-                if re.fullmatch(r"\d{4}-\d{2}-\d{2}T[\d:]+(?:\.\d+)?Z?", raw):
+                if _DATETIME_RE.fullmatch(raw):
                     return datetime.fromisoformat(raw.replace("Z", "+00:00"))
             except ValueError:
                 pass
@@ -193,35 +196,48 @@ class PageParams:
                 pass
             return raw
 
-        # Parse filter string into parts, handling quoted values
+        # Split the filter string into 'field__op=value' segments. A comma outside
+        # quotes starts a new segment only when another '=' follows before the next
+        # comma, so list values such as 'status__in=a,b' stay in one segment. The
+        # scan jumps between quotes and commas with str.find instead of walking
+        # every character.
         filter_parts: list[str] = []
+        append_part = filter_parts.append
+        find = filters_str.find
+        length = len(filters_str)
         in_quotes = False
         start = 0
-        i = 0
-        length = len(filters_str)
-        while i < length:
-            ch = filters_str[i]
-            if ch == '"' and (i == 0 or filters_str[i - 1] != "\\"):
-                in_quotes = not in_quotes
-
-            if ch == "," and not in_quotes:
-                j = i + 1
+        next_quote = find('"')
+        next_comma = find(",")
+        # Position of the first '=' at or after the last lookup; `length` when none
+        next_eq = -1
+        while next_comma != -1:
+            if next_quote != -1 and next_quote < next_comma:
+                if next_quote == 0 or filters_str[next_quote - 1] != "\\":
+                    in_quotes = not in_quotes
+                next_quote = find('"', next_quote + 1)
+                continue
+
+            pos = next_comma + 1
+            following_comma = find(",", pos)
+            if not in_quotes:
+                j = pos
                 while j < length and filters_str[j] == " ":
                     j += 1
-
-                next_eq = filters_str.find("=", j)
-                next_comma = filters_str.find(",", j)
-
-                if next_eq != -1 and (next_comma == -1 or next_eq < next_comma):
-                    segment = filters_str[start:i].strip()
+                if next_eq < j:
+                    next_eq = find("=", j)
+                    if next_eq == -1:
+                        next_eq = length
+                if next_eq != length and (following_comma == -1 or next_eq < following_comma):
+                    segment = filters_str[start:next_comma].strip()
                     if segment:
-                        filter_parts.append(segment)
-                    start = i + 1
-            i += 1
+                        append_part(segment)
+                    start = pos
+            next_comma = following_comma
 
         last_seg = filters_str[start:].strip()
         if last_seg:
-            filter_parts.append(last_seg)
+            append_part(last_seg)
 
         filters: Dict[str, Dict[str, Any]] = {}
 
@@ -244,10 +260,11 @@ class PageParams:
             else:
                 field, op = key, "eq"
 
-            op = alias_map.get(op.lower(), op.lower())
-
-            if op not in canonical_ops:
+            op = op.lower()
+            canonical = _OPERATORS.get(op)
+            if canonical is None:
                 raise FilterError(f"Unsupported operator '{op}' in filter '{part}'.")
+            op = canonical
 
             if field in filters:
                 raise FilterError(f"Duplicate filter for field '{field}'. Only one allowed.")
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import uuid
+from typing import List, Optional
+
+from sample.db import async_session_maker
+from sample.models import Analytics
+
+logger = logging.getLogger(__name__)
+
+# Events are written in batches of up to BATCH_SIZE rows, or whatever has
+# accumulated FLUSH_INTERVAL seconds after the first event of a batch arrived.
+BATCH_SIZE = 100
+FLUSH_INTERVAL = 0.05
+
+# A None on the queue tells the writer to finish its current batch and exit
+_queue: "asyncio.Queue[Optional[Analytics]]" = asyncio.Queue()
+
+
+def record_event(
+    event_type: str,
+    entity_type: str,
+    entity_id: uuid.UUID,
+    user_id: Optional[uuid.UUID] = None,
+) -> None:
+    """Queue an analytics event; it is persisted by the background writer."""
+    _queue.put_nowait(
+        Analytics(
+            event_type=event_type,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            user_id=user_id,
+        )
+    )
+
+
+async def _write_batch(batch: List[Analytics]) -> None:
+    async with async_session_maker() as session:
+        session.add_all(batch)
+        await session.commit()
+
+
+async def run_analytics_writer() -> None:
+    """Drain the event queue, committing one batch per round-trip, until stopped."""
+    loop = asyncio.get_running_loop()
+    stopping = False
+    while not stopping:
+        event = await _queue.get()
+        if event is None:
+            return
+        batch = [event]
+        deadline = loop.time() + FLUSH_INTERVAL
+        while len(batch) < BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                event = await asyncio.wait_for(_queue.get(), timeout)
+            except TimeoutError:
+                break
+            if event is None:
+                stopping = True
+                break
+            batch.append(event)
+
+        try:
+            await _write_batch(batch)
+        except Exception:
+            logger.exception("Failed to write %s analytics events", len(batch))
+
+
+def stop_analytics_writer() -> None:
+    """Ask the writer to write out the batch it holds and exit."""
+    _queue.put_nowait(None)
+
+
+async def flush_analytics() -> None:
+    """Write out any events still queued, e.g. on application shutdown."""
+    batch: List[Analytics] = []
+    while not _queue.empty():
+        event = _queue.get_nowait()
+        if event is not None:
+            batch.append(event)
+    if batch:
+        await _write_batch(batch)
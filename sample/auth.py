@@ -1,14 +1,45 @@
 # Lets try basic auth
+import asyncio
+
+import bcrypt
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from sample.db import get_session
 from sample.models import User
 
 
+def _password_bytes(password: str) -> bytes:
+    # bcrypt only looks at the first 72 bytes of the secret
+    return password.encode()[:72]
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password with bcrypt in a worker thread, off the event loop."""
+    hashed = await asyncio.to_thread(bcrypt.hashpw, _password_bytes(password), bcrypt.gensalt())
+    return hashed.decode()
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    """Check a password against a bcrypt hash in a worker thread."""
+    try:
+        return await asyncio.to_thread(bcrypt.checkpw, _password_bytes(password), hashed.encode())
+    except ValueError:
+        # Not a bcrypt hash (e.g. a legacy digest), so it can never match
+        return False
+
+
 async def get_user_by_credentials(
     credentials: HTTPBasicCredentials = Depends(HTTPBasic()),
+    session: AsyncSession = Depends(get_session),
 ) -> User:
-    user = await get_user_by_credentials(credentials)
-    if not user:
-        raise HTTPException(status_code=401, detail="Invalid credentials")
+    user = await session.scalar(select(User).where(User.username == credentials.username))
+    if not user or not await verify_password(credentials.password, user.password):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid credentials",
+            headers={"WWW-Authenticate": "Basic"},
+        )
     return user
@@ -1,19 +1,24 @@
-import datetime
-import hashlib
+import logging
+import re
 import uuid
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, exists, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from auto_crud.core.crud.base import CRUDHooks
 from auto_crud.core.errors import ValidationError
-from sample.models import Analytics, Category, Comment, Like, Post, Tag, User
+from sample.analytics import record_event
+from sample.auth import hash_password
+from sample.models import Category, Comment, Like, Post, Tag, User, post_tags
 from sample.schemas import (
     CategoryCreate,
     CategoryUpdate,
     CommentCreate,
     CommentUpdate,
+    LikeCreate,
     PostCreate,
     PostStatus,
     PostUpdate,
@@ -21,9 +26,32 @@ from sample.schemas import (
     TagUpdate,
     UserCreate,
     UserUpdate,
+    generate_slug,
 )
 
 
+logger = logging.getLogger(__name__)
+
+# All spam phrases folded into one case-insensitive pattern so a comment is
+# scanned once instead of once per phrase.
+_SPAM_WORDS = ["spam", "buy now", "click here", "free money"]
+_SPAM_PATTERN = re.compile("|".join(map(re.escape, _SPAM_WORDS)), re.IGNORECASE)
+
+
+async def adjust_tag_usage(db_session: AsyncSession, post_id: uuid.UUID, delta: int) -> None:
+    """Add ``delta`` to the usage count of every tag attached to a post.
+
+    Works straight off the association table, so the lazy Post.tags
+    relationship is never loaded; counts never drop below zero.
+    """
+    stmt = update(Tag).where(
+        Tag.id.in_(select(post_tags.c.tag_id).where(post_tags.c.post_id == post_id))
+    )
+    if delta < 0:
+        stmt = stmt.where(Tag.usage_count >= -delta)
+    await db_session.execute(stmt.values(usage_count=Tag.usage_count + delta))
+
+
 class UserHooks(CRUDHooks[User, uuid.UUID, UserCreate, UserUpdate]):
     """Comprehensive hooks for User operations"""
 
@@ -32,7 +60,7 @@ class UserHooks(CRUDHooks[User, uuid.UUID, UserCreate, UserUpdate]):
     ) -> UserCreate:
         """Pre-create hook for users"""
         # Hash password
-        obj_in.password = hashlib.sha256(obj_in.password.encode()).hexdigest()
+        obj_in.password = await hash_password(obj_in.password)
 
         # Set default username if not provided
         if not obj_in.username:
@@ -42,20 +70,18 @@ class UserHooks(CRUDHooks[User, uuid.UUID, UserCreate, UserUpdate]):
         if obj_in.email.endswith("@example.com"):
             raise ValidationError("Cannot use example.com domain for real users")
 
-        print(f"Creating user: {obj_in.username} ({obj_in.email})")
+        logger.debug("Creating user: %s (%s)", obj_in.username, obj_in.email)
         return obj_in
 
     async def post_create(self, db_session: AsyncSession, obj: User, *args, **kwargs) -> User:
         """Post-create hook for users"""
 
-        analytics = Analytics(
+        record_event(
             event_type="user_created",
             entity_type="user",
             entity_id=obj.id,
             user_id=obj.id,
         )
-        db_session.add(analytics)
-        await db_session.commit()
 
         return obj
 
@@ -66,10 +92,10 @@ class UserHooks(CRUDHooks[User, uuid.UUID, UserCreate, UserUpdate]):
         obj_in: UserUpdate | Dict[str, Any],
         user: Optional[User] = None,
     ) -> User:
-        if isinstance(obj_in, dict):
-            obj_in = UserUpdate.model_validate(obj_in)
-
-        if obj_in.role and obj_in.role.value in ["admin", "moderator"]:
+        # Only the role is needed, so read it without re-validating the whole
+        # payload; UserRole is a str enum, so it compares equal to raw strings
+        role = obj_in.get("role") if isinstance(obj_in, dict) else obj_in.role
+        if role in ("admin", "moderator"):
             if not user or user.role.value not in ["admin"]:
                 raise ValueError("Insufficient permissions to assign admin/moderator role")
 
@@ -77,17 +103,15 @@ class UserHooks(CRUDHooks[User, uuid.UUID, UserCreate, UserUpdate]):
 
     async def post_update(self, db_session: AsyncSession, obj: User, *args, **kwargs) -> User:
         """Post-update hook for users"""
-        print(f"User updated successfully: {obj.username}")
+        logger.debug("User updated successfully: %s", obj.username)
 
         # Create analytics entry
-        analytics = Analytics(
+        record_event(
             event_type="user_updated",
             entity_type="user",
             entity_id=obj.id,
             user_id=obj.id,
         )
-        db_session.add(analytics)
-        await db_session.commit()
 
         return obj
 
@@ -98,30 +122,30 @@ class UserHooks(CRUDHooks[User, uuid.UUID, UserCreate, UserUpdate]):
             return False
 
         # Check if user has published posts
-        published_posts = await db_session.execute(
-            select(Post).where(and_(Post.author_id == obj.id, Post.status == PostStatus.PUBLISHED))
+        has_published_posts = await db_session.scalar(
+            select(
+                exists().where(and_(Post.author_id == obj.id, Post.status == PostStatus.PUBLISHED))
+            )
         )
-        if published_posts.scalar():
-            print(f"Cannot delete user with published posts: {obj.username}")
+        if has_published_posts:
+            logger.info("Cannot delete user with published posts: %s", obj.username)
             return False
 
-        print(f"Deleting user: {obj.username}")
+        logger.debug("Deleting user: %s", obj.username)
         return True
 
     async def post_delete(self, db_session: AsyncSession, obj: User, *args, **kwargs) -> User:
         """Post-delete hook for users"""
-        print(f"User deleted successfully: {obj.username}")
+        logger.debug("User deleted successfully: %s", obj.username)
 
         # Create analytics entry
-        analytics = Analytics(event_type="user_deleted", entity_type="user", entity_id=obj.id)
-        db_session.add(analytics)
-        await db_session.commit()
+        record_event(event_type="user_deleted", entity_type="user", entity_id=obj.id)
 
         return obj
 
     async def pre_read(self, db_session: AsyncSession, obj_id: uuid.UUID, *args, **kwargs) -> Any:
         """Pre-read hook for users"""
-        print(f"Reading user: {obj_id}")
+        logger.debug("Reading user: %s", obj_id)
         return obj_id
 
     async def post_read(
@@ -129,11 +153,13 @@ class UserHooks(CRUDHooks[User, uuid.UUID, UserCreate, UserUpdate]):
     ) -> Optional[User]:
         """Post-read hook for users"""
         if obj:
-            print(f"User read: {obj.username}")
+            logger.debug("User read: %s", obj.username)
 
             # Update last login if this is a login event
             if kwargs.get("is_login", False):
-                obj.last_login = datetime.datetime.utcnow()
+                # last_login is a naive UTC column, so drop the tzinfo after
+                # taking an aware timestamp
+                obj.last_login = datetime.now(timezone.utc).replace(tzinfo=None)
                 await db_session.commit()
 
         return obj
@@ -146,15 +172,6 @@ class PostHooks(CRUDHooks[Post, uuid.UUID, PostCreate, PostUpdate]):
         self, db_session: AsyncSession, obj_in: PostCreate, *args, **kwargs
     ) -> PostCreate:
         """Pre-create hook for posts"""
-        # Generate slug if not provided
-        if not obj_in.slug:
-            obj_in.slug = self._generate_slug(obj_in.title)
-
-        # Calculate reading time if not provided
-        if not obj_in.reading_time:
-            word_count = len(obj_in.content.split())
-            obj_in.reading_time = max(1, word_count // 200)
-
         # Validate content length
         if len(obj_in.content.strip()) < 100:
             raise ValueError("Post content must be at least 100 characters long")
@@ -167,28 +184,20 @@ class PostHooks(CRUDHooks[Post, uuid.UUID, PostCreate, PostUpdate]):
                 obj_in.excerpt[:160] if obj_in.excerpt else obj_in.content[:160]
             )
 
-        print(f"Creating post: {obj_in.title}")
+        logger.debug("Creating post: %s", obj_in.title)
         return obj_in
 
     async def post_create(self, db_session: AsyncSession, obj: Post, *args, **kwargs) -> Post:
         """Post-create hook for posts"""
-        print(f"Post created successfully: {obj.title} (ID: {obj.id})")
-
-        # Update tag usage counts
-        if hasattr(obj, "tags") and obj.tags:
-            for tag in obj.tags:
-                tag.usage_count += 1
-            await db_session.commit()
+        logger.debug("Post created successfully: %s (ID: %s)", obj.title, obj.id)
 
         # Create analytics entry
-        analytics = Analytics(
+        record_event(
             event_type="post_created",
             entity_type="post",
             entity_id=obj.id,
             user_id=obj.author_id,
         )
-        db_session.add(analytics)
-        await db_session.commit()
 
         return obj
 
@@ -196,20 +205,11 @@ class PostHooks(CRUDHooks[Post, uuid.UUID, PostCreate, PostUpdate]):
         self,
         db_session: AsyncSession,
         obj: Post,
-        obj_in: PostUpdate,
+        obj_in: PostUpdate | Dict[str, Any],
         user: Optional[Any] = None,
     ) -> Post:
         """Pre-update hook for posts"""
-        print(f"Updating post: {obj.title}")
-
-        # Generate slug if title changed and slug not provided
-        if obj_in.title and not obj_in.slug:
-            obj_in.slug = self._generate_slug(obj_in.title)
-
-        # Calculate reading time if content changed
-        if obj_in.content and not obj_in.reading_time:
-            word_count = len(obj_in.content.split())
-            obj_in.reading_time = max(1, word_count // 200)
+        logger.debug("Updating post: %s", obj.title)
 
         # Prevent editing published posts by non-authors
         if obj.status.value == "published" and user and user.id != obj.author_id:
@@ -220,31 +220,18 @@ class PostHooks(CRUDHooks[Post, uuid.UUID, PostCreate, PostUpdate]):
 
     async def post_update(self, db_session: AsyncSession, obj: Post, *args, **kwargs) -> Post:
         """Post-update hook for posts"""
-        print(f"Post updated successfully: {obj.title}")
+        logger.debug("Post updated successfully: %s", obj.title)
 
-        # Update comment count
-        comment_count = await db_session.execute(
-            select(func.count(Comment.id)).where(Comment.post_id == obj.id)
-        )
-        obj.comment_count = comment_count.scalar() or 0
-
-        # Update like count
-        like_count = await db_session.execute(
-            select(func.count(Like.id)).where(Like.post_id == obj.id)
-        )
-        obj.like_count = like_count.scalar() or 0
-
-        await db_session.commit()
+        # comment_count and like_count are kept in sync incrementally by
+        # CommentHooks and LikeHooks, so there is nothing to recount here.
 
         # Create analytics entry
-        analytics = Analytics(
+        record_event(
             event_type="post_updated",
             entity_type="post",
             entity_id=obj.id,
             user_id=obj.author_id,
         )
-        db_session.add(analytics)
-        await db_session.commit()
 
         return obj
 
@@ -252,37 +239,33 @@ class PostHooks(CRUDHooks[Post, uuid.UUID, PostCreate, PostUpdate]):
         """Pre-delete hook for posts"""
         # Prevent deletion of published posts
         if obj.status.value == "published":
-            print(f"Attempted to delete published post: {obj.title}")
+            logger.info("Attempted to delete published post: %s", obj.title)
             return False
 
-        print(f"Deleting post: {obj.title}")
+        logger.debug("Deleting post: %s", obj.title)
+
+        # Update tag usage counts while the post_tags rows still exist; they
+        # are removed along with the post
+        await adjust_tag_usage(db_session, obj.id, -1)
         return True
 
     async def post_delete(self, db_session: AsyncSession, obj: Post, *args, **kwargs) -> Post:
         """Post-delete hook for posts"""
-        print(f"Post deleted successfully: {obj.title}")
-
-        # Update tag usage counts
-        if hasattr(obj, "tags") and obj.tags:
-            for tag in obj.tags:
-                tag.usage_count = max(0, tag.usage_count - 1)
-            await db_session.commit()
+        logger.debug("Post deleted successfully: %s", obj.title)
 
         # Create analytics entry
-        analytics = Analytics(
+        record_event(
             event_type="post_deleted",
             entity_type="post",
             entity_id=obj.id,
             user_id=obj.author_id,
         )
-        db_session.add(analytics)
-        await db_session.commit()
 
         return obj
 
     async def pre_read(self, db_session: AsyncSession, obj_id: uuid.UUID, *args, **kwargs) -> Any:
         """Pre-read hook for posts"""
-        print(f"Reading post: {obj_id}")
+        logger.debug("Reading post: %s", obj_id)
         return obj_id
 
     async def post_read(
@@ -290,28 +273,24 @@ class PostHooks(CRUDHooks[Post, uuid.UUID, PostCreate, PostUpdate]):
     ) -> Optional[Post]:
         """Post-read hook for posts"""
         if obj:
-            # Increment view count
-            obj.view_count += 1
+            # Increment view count atomically in the database
+            view_count = await db_session.scalar(
+                update(Post)
+                .where(Post.id == obj.id)
+                .values(view_count=Post.view_count + 1)
+                .returning(Post.view_count),
+                execution_options={"synchronize_session": False},
+            )
             await db_session.commit()
+            set_committed_value(obj, "view_count", view_count)
 
-            print(f"Post read: {obj.title} (views: {obj.view_count})")
+            logger.debug("Post read: %s (views: %s)", obj.title, obj.view_count)
 
             # Create analytics entry
-            analytics = Analytics(event_type="post_view", entity_type="post", entity_id=obj.id)
-            db_session.add(analytics)
-            await db_session.commit()
+            record_event(event_type="post_view", entity_type="post", entity_id=obj.id)
 
         return obj
 
-    def _generate_slug(self, title: str) -> str:
-        """Generate a URL-friendly slug from title"""
-        import re
-
-        # Convert to lowercase and replace spaces with hyphens
-        slug = re.sub(r"[^\w\s-]", "", title.lower())
-        slug = re.sub(r"[-\s]+", "-", slug)
-        return slug.strip("-")[:200]  # Limit to 200 characters
-
 
 class CategoryHooks(CRUDHooks[Category, uuid.UUID, CategoryCreate, CategoryUpdate]):
     """Hooks for Category operations"""
@@ -322,38 +301,26 @@ class CategoryHooks(CRUDHooks[Category, uuid.UUID, CategoryCreate, CategoryUpdat
         """Pre-create hook for categories"""
         # Generate slug if not provided
         if not obj_in.slug:
-            obj_in.slug = self._generate_slug(obj_in.name)
+            obj_in.slug = generate_slug(obj_in.name, 100)
 
         # Validate color format
         if obj_in.color and not obj_in.color.startswith("#"):
             obj_in.color = f"#{obj_in.color}"
 
-        print(f"Creating category: {obj_in.name}")
+        logger.debug("Creating category: %s", obj_in.name)
         return obj_in
 
     async def post_create(
         self, db_session: AsyncSession, obj: Category, *args, **kwargs
     ) -> Category:
         """Post-create hook for categories"""
-        print(f"Category created successfully: {obj.name}")
+        logger.debug("Category created successfully: %s", obj.name)
 
         # Create analytics entry
-        analytics = Analytics(
-            event_type="category_created", entity_type="category", entity_id=obj.id
-        )
-        db_session.add(analytics)
-        await db_session.commit()
+        record_event(event_type="category_created", entity_type="category", entity_id=obj.id)
 
         return obj
 
-    def _generate_slug(self, name: str) -> str:
-        """Generate a URL-friendly slug from name"""
-        import re
-
-        slug = re.sub(r"[^\w\s-]", "", name.lower())
-        slug = re.sub(r"[-\s]+", "-", slug)
-        return slug.strip("-")[:100]
-
 
 class TagHooks(CRUDHooks[Tag, uuid.UUID, TagCreate, TagUpdate]):
     """Hooks for Tag operations"""
@@ -364,34 +331,24 @@ class TagHooks(CRUDHooks[Tag, uuid.UUID, TagCreate, TagUpdate]):
         """Pre-create hook for tags"""
         # Generate slug if not provided
         if not obj_in.slug:
-            obj_in.slug = self._generate_slug(obj_in.name)
+            obj_in.slug = generate_slug(obj_in.name, 50)
 
         # Validate color format
         if obj_in.color and not obj_in.color.startswith("#"):
             obj_in.color = f"#{obj_in.color}"
 
-        print(f"Creating tag: {obj_in.name}")
+        logger.debug("Creating tag: %s", obj_in.name)
         return obj_in
 
     async def post_create(self, db_session: AsyncSession, obj: Tag, *args, **kwargs) -> Tag:
         """Post-create hook for tags"""
-        print(f"Tag created successfully: {obj.name}")
+        logger.debug("Tag created successfully: %s", obj.name)
 
         # Create analytics entry
-        analytics = Analytics(event_type="tag_created", entity_type="tag", entity_id=obj.id)
-        db_session.add(analytics)
-        await db_session.commit()
+        record_event(event_type="tag_created", entity_type="tag", entity_id=obj.id)
 
         return obj
 
-    def _generate_slug(self, name: str) -> str:
-        """Generate a URL-friendly slug from name"""
-        import re
-
-        slug = re.sub(r"[^\w\s-]", "", name.lower())
-        slug = re.sub(r"[-\s]+", "-", slug)
-        return slug.strip("-")[:50]
-
 
 class CommentHooks(CRUDHooks[Comment, uuid.UUID, CommentCreate, CommentUpdate]):
     """Hooks for Comment operations"""
@@ -401,34 +358,31 @@ class CommentHooks(CRUDHooks[Comment, uuid.UUID, CommentCreate, CommentUpdate]):
     ) -> CommentCreate:
         """Pre-create hook for comments"""
         # Basic spam detection (note: these fields are set in the model, not schema)
-        spam_words = ["spam", "buy now", "click here", "free money"]
-        content_lower = obj_in.content.lower()
-        if any(word in content_lower for word in spam_words):
+        if _SPAM_PATTERN.search(obj_in.content):
             # Mark as spam in the database during creation
-            print(f"Spam detected in comment: {obj_in.content[:50]}...")
+            logger.info("Spam detected in comment: %s...", obj_in.content[:50])
 
-        print(f"Creating comment for post: {obj_in.post_id}")
+        logger.debug("Creating comment for post: %s", obj_in.post_id)
         return obj_in
 
     async def post_create(self, db_session: AsyncSession, obj: Comment, *args, **kwargs) -> Comment:
         """Post-create hook for comments"""
-        print(f"Comment created successfully: {obj.id}")
+        logger.debug("Comment created successfully: %s", obj.id)
 
         # Update post comment count
-        post = await db_session.get(Post, obj.post_id)
-        if post:
-            post.comment_count += 1
-            await db_session.commit()
+        await db_session.execute(
+            update(Post)
+            .where(Post.id == obj.post_id)
+            .values(comment_count=Post.comment_count + 1)
+        )
 
         # Create analytics entry
-        analytics = Analytics(
+        record_event(
             event_type="comment_created",
             entity_type="comment",
             entity_id=obj.id,
             user_id=obj.author_id,
         )
-        db_session.add(analytics)
-        await db_session.commit()
 
         return obj
 
@@ -440,7 +394,7 @@ class CommentHooks(CRUDHooks[Comment, uuid.UUID, CommentCreate, CommentUpdate]):
         user: Optional[Any] = None,
     ) -> Comment:
         """Pre-update hook for comments"""
-        print(f"Updating comment: {obj.id}")
+        logger.debug("Updating comment: %s", obj.id)
 
         # Only allow authors or moderators to edit comments
         if user and user.id != obj.author_id:
@@ -451,43 +405,80 @@ class CommentHooks(CRUDHooks[Comment, uuid.UUID, CommentCreate, CommentUpdate]):
 
     async def post_update(self, db_session: AsyncSession, obj: Comment, *args, **kwargs) -> Comment:
         """Post-update hook for comments"""
-        print(f"Comment updated successfully: {obj.id}")
+        logger.debug("Comment updated successfully: %s", obj.id)
 
         # Create analytics entry
-        analytics = Analytics(
+        record_event(
             event_type="comment_updated",
             entity_type="comment",
             entity_id=obj.id,
             user_id=obj.author_id,
         )
-        db_session.add(analytics)
-        await db_session.commit()
 
         return obj
 
     async def pre_delete(self, db_session: AsyncSession, obj: Comment, *args, **kwargs) -> bool:
         """Pre-delete hook for comments"""
-        print(f"Deleting comment: {obj.id}")
+        logger.debug("Deleting comment: %s", obj.id)
         return True
 
     async def post_delete(self, db_session: AsyncSession, obj: Comment, *args, **kwargs) -> Comment:
         """Post-delete hook for comments"""
-        print(f"Comment deleted successfully: {obj.id}")
+        logger.debug("Comment deleted successfully: %s", obj.id)
 
         # Update post comment count
-        post = await db_session.get(Post, obj.post_id)
-        if post:
-            post.comment_count = max(0, post.comment_count - 1)
-            await db_session.commit()
+        await db_session.execute(
+            update(Post)
+            .where(Post.id == obj.post_id, Post.comment_count > 0)
+            .values(comment_count=Post.comment_count - 1)
+        )
 
         # Create analytics entry
-        analytics = Analytics(
+        record_event(
             event_type="comment_deleted",
             entity_type="comment",
             entity_id=obj.id,
             user_id=obj.author_id,
         )
-        db_session.add(analytics)
-        await db_session.commit()
+
+        return obj
+
+
+class LikeHooks(CRUDHooks[Like, uuid.UUID, LikeCreate, LikeCreate]):
+    """Hooks for Like operations"""
+
+    async def post_create(self, db_session: AsyncSession, obj: Like, *args, **kwargs) -> Like:
+        """Post-create hook for likes"""
+        # Update post like count
+        await db_session.execute(
+            update(Post).where(Post.id == obj.post_id).values(like_count=Post.like_count + 1)
+        )
+
+        # Create analytics entry
+        record_event(
+            event_type="post_liked",
+            entity_type="post",
+            entity_id=obj.post_id,
+            user_id=obj.user_id,
+        )
+
+        return obj
+
+    async def post_delete(self, db_session: AsyncSession, obj: Like, *args, **kwargs) -> Like:
+        """Post-delete hook for likes"""
+        # Update post like count
+        await db_session.execute(
+            update(Post)
+            .where(Post.id == obj.post_id, Post.like_count > 0)
+            .values(like_count=Post.like_count - 1)
+        )
+
+        # Create analytics entry
+        record_event(
+            event_type="post_unliked",
+            entity_type="post",
+            entity_id=obj.post_id,
+            user_id=obj.user_id,
+        )
 
         return obj
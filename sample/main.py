@@ -1,3 +1,5 @@
+import asyncio
+import os
 from contextlib import asynccontextmanager
 
 import uvicorn
@@ -7,17 +9,27 @@ from fastapi.responses import JSONResponse
 
 from auto_crud.core.errors import FilterError
 
-from .db import init_database
-from .post_crud import category_router, post_router, tag_router
+from .analytics import flush_analytics, run_analytics_writer, stop_analytics_writer
+from .db import init_database, warm_up_pool
+from .post_crud import category_router, comment_router, like_router, post_router, tag_router
 
 # from .user_crud import user_router
 from .user_crud import user_router
 
+CORS_ORIGINS = os.getenv(
+    "CORS_ORIGINS", "http://localhost:3000,http://localhost:8000"
+).split(",")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_database()
+    await warm_up_pool()
+    analytics_writer = asyncio.create_task(run_analytics_writer())
     yield
+    stop_analytics_writer()
+    await analytics_writer
+    await flush_analytics()
 
 
 app = FastAPI(
@@ -50,13 +62,15 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Add CORS middleware
+# Add CORS middleware. Origins, methods and headers are listed explicitly:
+# a wildcard origin is not valid together with credentials, and wildcards make
+# the middleware inspect and echo request headers on every call.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
 # Include all routers
@@ -64,6 +78,8 @@ app.include_router(user_router, prefix="/api/v1")
 app.include_router(post_router, prefix="/api/v1")
 app.include_router(category_router, prefix="/api/v1")
 app.include_router(tag_router, prefix="/api/v1")
+app.include_router(comment_router, prefix="/api/v1")
+app.include_router(like_router, prefix="/api/v1")
 
 
 @app.exception_handler(FilterError)
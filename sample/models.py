@@ -1,4 +1,6 @@
 import datetime
+import os
+import time
 import uuid
 from enum import Enum
 from typing import List, Optional
@@ -9,10 +11,12 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
     Text,
+    UniqueConstraint,
 )
 from sqlalchemy import (
     Enum as SQLEnum,
@@ -23,6 +27,24 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sample.schemas import UserRole
 
 
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so new primary keys
+    land at the right edge of the B-tree instead of scattering like uuid4.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | ((rand >> 62) & 0xFFF) << 64  # rand_a
+        | 0b10 << 62  # variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b
+    )
+    return uuid.UUID(int=value)
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -90,7 +112,7 @@ class PostStatus(str, Enum):
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
     email: Mapped[str] = mapped_column(String(100), unique=True, index=True)
     password: Mapped[str] = mapped_column(String(100))
@@ -152,14 +174,14 @@ class User(Base):
 class Category(Base):
     __tablename__ = "categories"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
     slug: Mapped[str] = mapped_column(String(100), unique=True, index=True)
     description: Mapped[Optional[str]] = mapped_column(Text)
     color: Mapped[Optional[str]] = mapped_column(String(7))  # Hex color
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     parent_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("categories.id")
+        UUID(as_uuid=True), ForeignKey("categories.id"), index=True
     )
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime, default=datetime.datetime.utcnow
@@ -181,7 +203,7 @@ class Category(Base):
 class Tag(Base):
     __tablename__ = "tags"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(50), unique=True, index=True)
     slug: Mapped[str] = mapped_column(String(50), unique=True, index=True)
     description: Mapped[Optional[str]] = mapped_column(String(200))
@@ -200,7 +222,7 @@ class Tag(Base):
 class Post(Base):
     __tablename__ = "posts"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     title: Mapped[str] = mapped_column(String(200), index=True)
     slug: Mapped[str] = mapped_column(String(200), unique=True, index=True)
     excerpt: Mapped[Optional[str]] = mapped_column(String(500))
@@ -215,7 +237,7 @@ class Post(Base):
     seo_description: Mapped[Optional[str]] = mapped_column(String(160))
     published_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
     author_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE")
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), index=True
     )
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime, default=datetime.datetime.utcnow
@@ -238,22 +260,31 @@ class Post(Base):
     )
 
 
+# Partial index for the listings that only ever look at published posts
+Index(
+    "ix_posts_published_at_published",
+    Post.published_at.desc(),
+    postgresql_where=Post.status == PostStatus.PUBLISHED,
+    sqlite_where=Post.status == PostStatus.PUBLISHED,
+)
+
+
 class Comment(Base):
     __tablename__ = "comments"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     content: Mapped[str] = mapped_column(Text)
     is_approved: Mapped[bool] = mapped_column(Boolean, default=False)
     is_spam: Mapped[bool] = mapped_column(Boolean, default=False)
     like_count: Mapped[int] = mapped_column(Integer, default=0)
     author_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE")
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), index=True
     )
     post_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE")
+        UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE"), index=True
     )
     parent_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("comments.id")
+        UUID(as_uuid=True), ForeignKey("comments.id"), index=True
     )
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime, default=datetime.datetime.utcnow
@@ -274,12 +305,12 @@ class Comment(Base):
 class Like(Base):
     __tablename__ = "likes"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE")
     )
     post_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE")
+        UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE"), index=True
     )
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime, default=datetime.datetime.utcnow
@@ -290,18 +321,21 @@ class Like(Base):
     post: Mapped["Post"] = relationship("Post", back_populates="likes")
 
     # Composite unique constraint
-    __table_args__ = (CheckConstraint("user_id != post_id", name="user_cannot_like_own_post"),)
+    __table_args__ = (
+        CheckConstraint("user_id != post_id", name="user_cannot_like_own_post"),
+        UniqueConstraint("user_id", "post_id", name="uq_likes_user_post"),
+    )
 
 
 class Analytics(Base):
     __tablename__ = "analytics"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     event_type: Mapped[str] = mapped_column(String(50), index=True)  # view, like, comment, etc.
     entity_type: Mapped[str] = mapped_column(String(50), index=True)  # post, user, etc.
     entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), index=True)
     user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL")
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), index=True
     )
     ip_address: Mapped[Optional[str]] = mapped_column(String(45))
     user_agent: Mapped[Optional[str]] = mapped_column(Text)
@@ -1,11 +1,9 @@
 import datetime
-import re
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Type
 
 from fastapi import Body, Depends, HTTPException
-from fastapi.responses import JSONResponse
-from sqlalchemy import func, select
+from sqlalchemy import Column, RowMapping, Table, bindparam, delete, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from auto_crud.core.crud.base import BaseCRUD
@@ -17,17 +15,31 @@ from auto_crud.core.schemas.pagination import (
 )
 from auto_crud.dependencies.page_param import PageParams
 from sample.db import get_session
-from sample.hooks import PostHooks
-from sample.models import Category, Comment, Post, PostStatus, Tag
+from sample.hooks import CommentHooks, LikeHooks, PostHooks, adjust_tag_usage
+from sample.models import (
+    Category,
+    Comment,
+    Like,
+    Post,
+    PostStatus,
+    Tag,
+    post_categories,
+    post_tags,
+)
 from sample.schemas import (
     BulkOperationResponse,
     CategoryCreate,
     CategoryResponse,
     CategoryUpdate,
+    CommentCreate,
     CommentResponse,
+    CommentUpdate,
+    LikeCreate,
+    LikeResponse,
     PostCreate,
     PostDetailResponse,
     PostResponse,
+    PostSummaryResponse,
     PostUpdate,
     TagCreate,
     TagResponse,
@@ -35,6 +47,63 @@ from sample.schemas import (
 )
 
 
+async def _link_post(
+    session: AsyncSession,
+    association: Table,
+    target: Type[Any],
+    post_id: uuid.UUID,
+    target_ids: List[uuid.UUID],
+) -> None:
+    """Attach existing rows of ``target`` to a post with one INSERT ... SELECT"""
+    target_column = next(column for column in association.c if column.name != "post_id")
+    await session.execute(
+        association.insert().from_select(
+            ["post_id", target_column.name],
+            select(literal(post_id, Post.id.type), target.id).where(target.id.in_(target_ids)),
+        )
+    )
+
+
+# Filters built from literals only; shared across requests and never mutated.
+# Per-request filters below use model_construct, as their fields and operators
+# are fixed by this module and need no validation.
+_PUBLISHED_FILTER = FilterParam(field="status", operator="eq", value=PostStatus.PUBLISHED.value)
+_ACTIVE_FILTER = FilterParam(field="is_active", operator="eq", value=True)
+_POST_SEARCH_FIELDS = ("title", "content", "excerpt")
+
+_post_stats_stmt = select(
+    Post.view_count,
+    select(func.count())
+    .select_from(Like)
+    .where(Like.post_id == bindparam("post_id"))
+    .scalar_subquery(),
+    select(func.count())
+    .select_from(Comment)
+    .where(Comment.post_id == bindparam("post_id"))
+    .scalar_subquery(),
+).where(Post.id == bindparam("post_id"))
+
+
+async def _list_post_summaries(
+    session: AsyncSession, association_column: Column, target_id: uuid.UUID
+) -> Sequence[RowMapping]:
+    """List the summary columns of the posts linked through ``association_column``"""
+    association = association_column.table
+    result = await session.execute(
+        select(
+            Post.id,
+            Post.title,
+            Post.slug,
+            Post.status,
+            Post.view_count,
+            Post.created_at,
+        )
+        .join(association, association.c.post_id == Post.id)
+        .where(association_column == target_id)
+    )
+    return result.mappings().all()
+
+
 class PostRouterFactory(RouterFactory[Post, uuid.UUID, PostCreate, PostUpdate]):
     @action(method="GET", detail=False, url_path="popular", response_model=List[PostResponse])
     async def get_popular_posts(
@@ -45,73 +114,71 @@ class PostRouterFactory(RouterFactory[Post, uuid.UUID, PostCreate, PostUpdate]):
     ):
         """Get popular posts based on views and likes"""
         filters = [
-            FilterParam(field="view_count", operator="ge", value=min_views),
-            FilterParam(field="like_count", operator="ge", value=min_likes),
-            FilterParam(field="status", operator="eq", value="published"),
+            FilterParam.model_construct(field="view_count", operator="ge", value=min_views),
+            FilterParam.model_construct(field="like_count", operator="ge", value=min_likes),
+            _PUBLISHED_FILTER,
         ]
         return await self.crud.list_objects(session, filters=filters)
 
+    async def _set_status(
+        self, session: AsyncSession, id: uuid.UUID, status: PostStatus, **values: Any
+    ) -> Post:
+        """Move a post to ``status`` with one UPDATE ... RETURNING and run the post-update hook"""
+        # The status guard makes the "already in this status" check part of the update
+        post = await session.scalar(
+            update(Post)
+            .where(Post.id == id, Post.status != status)
+            .values(status=status, **values)
+            .returning(Post)
+        )
+        if post is None:
+            if await self.crud.exists(session, id):
+                raise HTTPException(status_code=409, detail=f"Post is already {status.value}")
+            raise HTTPException(status_code=404, detail="Post not found")
+        post = await self.crud.hooks.post_update(session, post)
+        await session.commit()
+        return post
+
     @action(
         method="POST", detail=True, url_path="publish", status_code=200, response_model=PostResponse
     )
     async def publish_post(self, session: AsyncSession = Depends(get_session), *, id: uuid.UUID):
         """Publish a draft post"""
-        post = await self.crud.get_by_id(session, id)
-        if not post:
-            raise HTTPException(status_code=404, detail="Post not found")
-
-        if post.status == PostStatus.PUBLISHED:
-            raise HTTPException(status_code=400, detail="Post is already published")
-
-        update_data = {
-            "status": PostStatus.PUBLISHED,
-            "published_at": datetime.datetime.now(datetime.UTC),
-        }
-        return await self.crud.update(session, post, update_data)
+        return await self._set_status(
+            session,
+            id,
+            PostStatus.PUBLISHED,
+            published_at=datetime.datetime.now(datetime.UTC),
+        )
 
     @action(
         method="POST", detail=True, url_path="archive", status_code=200, response_model=PostResponse
     )
     async def archive_post(self, session: AsyncSession = Depends(get_session), *, id: uuid.UUID):
         """Archive a post"""
-        post = await self.crud.get_by_id(session, id)
-        if not post:
-            raise HTTPException(status_code=404, detail="Post not found")
-
-        update_data = {"status": PostStatus.ARCHIVED}
-        return await self.crud.update(session, post, update_data)
+        return await self._set_status(session, id, PostStatus.ARCHIVED)
 
     @action(
         method="GET",
         detail=True,
         url_path="stats",
         response_model=Dict[str, Any],
-        response_class=JSONResponse,
     )
     async def get_post_stats(
         self, session: AsyncSession = Depends(get_session), *, id: uuid.UUID
     ) -> Dict[str, Any]:
         """Get comprehensive post statistics"""
-        post = await self.crud.get_by_id(session, id, prefetch=["comments", "likes"])
-        if not post:
-            raise HTTPException(status_code=404, detail="Post not found")
-
-        stmt = select(
-            func.count(Post.likes.any()),
-            func.count(Post.comments.any()),
-        ).where(Post.id == post.id)
-
-        result = (await session.execute(stmt)).fetchone()
+        result = (await session.execute(_post_stats_stmt, {"post_id": id})).one_or_none()
         if not result:
             raise HTTPException(status_code=404, detail="Post not found")
-        total_likes, total_comments = result
+        view_count, total_likes, total_comments = result
 
         return {
-            "total_views": post.view_count,
+            "total_views": view_count,
             "total_likes": total_likes,
             "total_comments": total_comments,
             "average_engagement_rate": (total_likes + total_comments)
-            / max(post.view_count, 1)
+            / max(view_count, 1)
             * 100,
         }
 
@@ -144,15 +211,14 @@ class PostRouterFactory(RouterFactory[Post, uuid.UUID, PostCreate, PostUpdate]):
     ):
         filters = [
             *page_params.filters,
-            FilterParam(field="categories.id", operator="eq", value=category_id),
+            FilterParam.model_construct(field="categories.id", operator="eq", value=category_id),
         ]
 
         return await self.crud.list_objects(
             session,
             filters=filters,
-            prefetch=["categories"],
             search=page_params.search,
-            search_fields=["title", "content", "excerpt"],
+            search_fields=_POST_SEARCH_FIELDS,
             sorting=page_params.sort_by,
             pagination={
                 "page": page_params.page,
@@ -172,28 +238,28 @@ class PostRouterFactory(RouterFactory[Post, uuid.UUID, PostCreate, PostUpdate]):
         *,
         tag_id: uuid.UUID,
         status: Optional[str] = None,
-    ) -> List[PostResponse]:
+    ) -> List[Post]:
         """Get all posts with a specific tag"""
-        filters = [FilterParam(field="tags.id", operator="eq", value=tag_id)]
+        filters = [FilterParam.model_construct(field="tags.id", operator="eq", value=tag_id)]
 
         if status:
-            filters.append(FilterParam(field="status", operator="eq", value=status))
+            filters.append(FilterParam.model_construct(field="status", operator="eq", value=status))
 
-        posts = await self.crud.list_objects(session, filters=filters, prefetch=["tags"])
-        return [PostResponse.model_validate(post) for post in posts]
+        return await self.crud.list_objects(session, filters=filters)
 
     @action(method="POST", detail=False, url_path="bulk-archive")
     async def bulk_archive_posts(
         self, session: AsyncSession = Depends(get_session), *, post_ids: List[uuid.UUID]
     ) -> BulkOperationResponse:
-        posts = await self.crud.list_objects(
-            session, filters=[FilterParam(field="id", operator="in", value=post_ids)]
-        )
-        for post in posts:
-            post.status = PostStatus.ARCHIVED
-        updated_count = await self.crud.bulk_update(
-            session, [PostUpdate.model_validate(post) for post in posts]
+        result = await session.execute(
+            update(Post)
+            .where(Post.id.in_(post_ids))
+            .values(status=PostStatus.ARCHIVED)
+            .returning(Post.id)
+            .execution_options(synchronize_session=False)
         )
+        updated_count = len(result.scalars().all())
+        await session.commit()
 
         return BulkOperationResponse(
             success_count=updated_count, error_count=len(post_ids) - updated_count
@@ -204,13 +270,6 @@ class PostRouterFactory(RouterFactory[Post, uuid.UUID, PostCreate, PostUpdate]):
         session: AsyncSession = Depends(get_session),
         data: PostCreate = Body(...),
     ) -> Post:
-        if not data.slug:
-            data.slug = self._generate_slug(data.title)
-
-        if not data.reading_time:
-            word_count = len(data.content.split())
-            data.reading_time = max(1, word_count // 200)
-
         category_ids = data.category_ids
         tag_ids = data.tag_ids
 
@@ -218,26 +277,17 @@ class PostRouterFactory(RouterFactory[Post, uuid.UUID, PostCreate, PostUpdate]):
         create_data.pop("category_ids", None)
         create_data.pop("tag_ids", None)
 
-        # Create the post using the base class
-        post = await self.crud.create(session, obj_in=create_data, include=["categories", "tags"])
-
-        # Handle relationships if provided
-        if category_ids or tag_ids:
-            if category_ids:
-                # Fetch categories and add them to the post
-                categories = await session.execute(
-                    select(Category).where(Category.id.in_(category_ids))
-                )
-                post.categories.extend(categories.scalars().all())
-
-            if tag_ids:
-                # Fetch tags and add them to the post
-                tags = await session.execute(select(Tag).where(Tag.id.in_(tag_ids)))
-                post.tags.extend(tags.scalars().all())
+        # Create the post using the base class; it is committed together with
+        # its relationships below
+        post = await self.crud.create(session, obj_in=create_data, commit=False)
 
-            await session.commit()
-            await session.refresh(post)
+        if category_ids:
+            await _link_post(session, post_categories, Category, post.id, category_ids)
+        if tag_ids:
+            await _link_post(session, post_tags, Tag, post.id, tag_ids)
+            await adjust_tag_usage(session, post.id, 1)
 
+        await session.commit()
         return post
 
     async def perform_update(
@@ -252,15 +302,6 @@ class PostRouterFactory(RouterFactory[Post, uuid.UUID, PostCreate, PostUpdate]):
         if not post:
             raise HTTPException(status_code=404, detail="Post not found")
 
-        # Generate slug if title changed and slug not provided
-        if data.title and not data.slug:
-            data.slug = self._generate_slug(data.title)
-
-        # Calculate reading time if content changed
-        if data.content and not data.reading_time:
-            word_count = len(data.content.split())
-            data.reading_time = max(1, word_count // 200)
-
         # Extract relationship data
         category_ids = data.category_ids
         tag_ids = data.tag_ids
@@ -270,105 +311,73 @@ class PostRouterFactory(RouterFactory[Post, uuid.UUID, PostCreate, PostUpdate]):
         update_data.pop("category_ids", None)
         update_data.pop("tag_ids", None)
 
-        # Update the post using the base class
-        updated_post = await self.crud.update(session, obj=post, obj_in=update_data)
-
-        # Handle relationships if provided
-        if category_ids is not None or tag_ids is not None:
-            if category_ids is not None:
-                # Clear existing categories and add new ones
-                updated_post.categories.clear()
-                if category_ids:
-                    categories = await session.execute(
-                        select(Category).where(Category.id.in_(category_ids))
-                    )
-                    updated_post.categories.extend(categories.scalars().all())
-
-            if tag_ids is not None:
-                # Clear existing tags and add new ones
-                updated_post.tags.clear()
-                if tag_ids:
-                    tags = await tag_crud.list_objects(
-                        session, filters=[FilterParam(field="id", operator="in", value=tag_ids)]
-                    )
-                    updated_post.tags.extend(tags)
-
-            await session.commit()
-            await session.refresh(updated_post)
+        # Update the post using the base class; it is committed together with
+        # its relationships below
+        updated_post = await self.crud.update(session, obj=post, obj_in=update_data, commit=False)
 
-        return updated_post
+        # Replace relationships if provided
+        if category_ids is not None:
+            await session.execute(delete(post_categories).where(post_categories.c.post_id == id))
+            if category_ids:
+                await _link_post(session, post_categories, Category, id, category_ids)
+
+        if tag_ids is not None:
+            await adjust_tag_usage(session, id, -1)
+            await session.execute(delete(post_tags).where(post_tags.c.post_id == id))
+            if tag_ids:
+                await _link_post(session, post_tags, Tag, id, tag_ids)
+                await adjust_tag_usage(session, id, 1)
 
-    def _generate_slug(self, title: str) -> str:
-        slug = re.sub(r"[^\w\s-]", "", title.lower())
-        slug = re.sub(r"[-\s]+", "-", slug)
-        return slug.strip("-")[:200]
+        await session.commit()
+        return updated_post
 
 
 # Category CRUD Router
 class CategoryRouterFactory(RouterFactory[Category, uuid.UUID, CategoryCreate, CategoryUpdate]):
     """Extended CRUD router for Categories"""
 
-    @action(method="GET", detail=False, url_path="active")
+    @action(
+        method="GET", detail=False, url_path="active", response_model=List[CategoryResponse]
+    )
     async def get_active_categories(
         self, session: AsyncSession = Depends(get_session)
-    ) -> List[CategoryResponse]:
+    ) -> List[Category]:
         """Get all active categories"""
-        filters = [FilterParam(field="is_active", operator="eq", value=True)]
-        categories = await self.crud.list_objects(session, filters=filters)
-        return [CategoryResponse.model_validate(cat) for cat in categories]
+        return await self.crud.list_objects(session, filters=[_ACTIVE_FILTER])
 
-    @action(method="GET", detail=True, url_path="posts")
+    @action(
+        method="GET", detail=True, url_path="posts", response_model=List[PostSummaryResponse]
+    )
     async def get_category_posts(
         self, session: AsyncSession = Depends(get_session), *, id: uuid.UUID
-    ) -> List[Dict[str, Any]]:
+    ) -> Sequence[RowMapping]:
         """Get all posts in a category"""
-        category = await self.crud.get_by_id(session, id, prefetch=["posts"])
-        if not category:
+        if not await self.crud.exists(session, id):
             raise HTTPException(status_code=404, detail="Category not found")
 
-        return [
-            {
-                "id": str(post.id),
-                "title": post.title,
-                "slug": post.slug,
-                "status": post.status,
-                "view_count": post.view_count,
-                "created_at": post.created_at.isoformat(),
-            }
-            for post in category.posts
-        ]
+        return await _list_post_summaries(session, post_categories.c.category_id, id)
 
 
 class TagRouterFactory(RouterFactory[Tag, uuid.UUID, TagCreate, TagUpdate]):
-    @action(method="GET", detail=False, url_path="popular")
+    @action(method="GET", detail=False, url_path="popular", response_model=List[TagResponse])
     async def get_popular_tags(
         self, session: AsyncSession = Depends(get_session), *, min_usage: int = 5
-    ) -> List[TagResponse]:
+    ) -> List[Tag]:
         """Get popular tags based on usage count"""
-        filters = [FilterParam(field="usage_count", operator="ge", value=min_usage)]
-        tags = await self.crud.list_objects(session, filters=filters)
-        return [TagResponse.model_validate(tag) for tag in tags]
+        filters = [FilterParam.model_construct(field="usage_count", operator="ge", value=min_usage)]
+        return await self.crud.list_objects(session, filters=filters)
 
-    @action(method="GET", detail=True, url_path="posts")
+    @action(
+        method="GET", detail=True, url_path="posts", response_model=List[PostSummaryResponse]
+    )
     async def get_tag_posts(
         self, session: AsyncSession = Depends(get_session), *, id: uuid.UUID
-    ) -> List[Dict[str, Any]]:
+    ) -> Sequence[RowMapping]:
         """Get all posts with a tag"""
-        tag = await self.crud.get_by_id(session, id, prefetch=["posts"])
-        if not tag:
+        if not await self.crud.exists(session, id):
             raise HTTPException(status_code=404, detail="Tag not found")
 
-        return [
-            {
-                "id": str(post.id),
-                "title": post.title,
-                "slug": post.slug,
-                "status": post.status,
-                "view_count": post.view_count,
-                "created_at": post.created_at.isoformat(),
-            }
-            for post in tag.posts
-        ]
+        return await _list_post_summaries(session, post_tags.c.tag_id, id)
 
 
 post_crud = BaseCRUD[Post, uuid.UUID, PostCreate, PostUpdate](
@@ -450,6 +459,63 @@ tag_router_factory = TagRouterFactory(
     },
 )
 
+# Comments and likes keep Post.comment_count / Post.like_count up to date in
+# their hooks. Bulk operations skip the hooks, so those endpoints are disabled.
+comment_crud = BaseCRUD[Comment, uuid.UUID, CommentCreate, CommentUpdate](
+    model=Comment,
+    hooks=CommentHooks(),
+)
+
+comment_router_factory = RouterFactory[Comment, uuid.UUID, CommentCreate, CommentUpdate](
+    crud=comment_crud,
+    session_factory=get_session,
+    create_schema=CommentCreate,
+    update_schema=CommentUpdate,
+    prefix="/comments",
+    tags=["comments"],
+    enable_bulk_create=False,
+    enable_bulk_update=False,
+    enable_bulk_delete=False,
+    sort_default="-created_at",
+    page_size=20,
+    max_page_size=50,
+    response_schemas={
+        "create": CommentResponse,
+        "update": CommentResponse,
+        "read": CommentResponse,
+        "list": CommentResponse,
+    },
+)
+
+
+like_crud = BaseCRUD[Like, uuid.UUID, LikeCreate, LikeCreate](
+    model=Like,
+    hooks=LikeHooks(),
+)
+
+like_router_factory = RouterFactory[Like, uuid.UUID, LikeCreate, LikeCreate](
+    crud=like_crud,
+    session_factory=get_session,
+    create_schema=LikeCreate,
+    update_schema=LikeCreate,
+    prefix="/likes",
+    tags=["likes"],
+    enable_update=False,
+    enable_bulk_create=False,
+    enable_bulk_update=False,
+    enable_bulk_delete=False,
+    sort_default="-created_at",
+    page_size=20,
+    max_page_size=50,
+    response_schemas={
+        "create": LikeResponse,
+        "read": LikeResponse,
+        "list": LikeResponse,
+    },
+)
+
 post_router = post_router_factory.get_router()
 category_router = category_router_factory.get_router()
 tag_router = tag_router_factory.get_router()
+comment_router = comment_router_factory.get_router()
+like_router = like_router_factory.get_router()
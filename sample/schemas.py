@@ -1,9 +1,19 @@
 import datetime
+import re
+import time
 import uuid
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    computed_field,
+    model_validator,
+    validator,
+)
 
 
 # Enums
@@ -21,15 +31,41 @@ class PostStatus(str, Enum):
     DELETED = "deleted"
 
 
+# A user counts as online for this long after their last login
+ONLINE_WINDOW_SECONDS = 300
+_UTC_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+# Shared string types, so each constraint is declared once for every schema.
+# Only these identifier-like fields are stripped; free text such as post
+# content and passwords is kept exactly as sent.
+Username = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True, min_length=3, max_length=50, pattern=r"^[a-zA-Z0-9_]+$"
+    ),
+]
+Email = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, max_length=100, pattern=r"^[^@]+@[^@]+\.[^@]+$"),
+]
+Slug = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1, pattern=r"^[a-z0-9-]+$")
+]
+HexColor = Annotated[str, StringConstraints(pattern=r"^#[0-9A-Fa-f]{6}$")]
+
+
 # Base schemas with common configurations
 class BaseSchema(BaseModel):
-    model_config = ConfigDict(from_attributes=True, str_strip_whitespace=True)
+    # defer_build: validators are built on first use, so schemas no route
+    # touches cost nothing at import time
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # User schemas
 class UserBase(BaseSchema):
-    username: str = Field(..., min_length=3, max_length=50, pattern=r"^[a-zA-Z0-9_]+$")
-    email: str = Field(..., max_length=100, pattern=r"^[^@]+@[^@]+\.[^@]+$")
+    username: Username
+    email: Email
     full_name: Optional[str] = Field(None, max_length=100)
     bio: Optional[str] = Field(None, max_length=500)
     avatar_url: Optional[str] = Field(None, max_length=255)
@@ -43,8 +79,8 @@ class UserCreate(UserBase):
 
 
 class UserUpdate(BaseSchema):
-    username: Optional[str] = Field(None, min_length=3, max_length=50, pattern=r"^[a-zA-Z0-9_]+$")
-    email: Optional[str] = Field(None, max_length=100, pattern=r"^[^@]+@[^@]+\.[^@]+$")
+    username: Optional[Username] = None
+    email: Optional[Email] = None
     full_name: Optional[str] = Field(None, max_length=100)
     bio: Optional[str] = Field(None, max_length=500)
     avatar_url: Optional[str] = Field(None, max_length=255)
@@ -69,7 +105,10 @@ class UserResponse(UserBase):
     def is_online(self) -> bool:
         if not self.last_login:
             return False
-        return (datetime.datetime.utcnow() - self.last_login).total_seconds() < 300  # 5 minutes
+        # last_login is naive UTC; measuring it from the epoch lets it be compared
+        # with time.time() without building a datetime for "now"
+        last_seen = (self.last_login - _UTC_EPOCH).total_seconds()
+        return time.time() - last_seen < ONLINE_WINDOW_SECONDS
 
 
 class UserDetailResponse(UserResponse):
@@ -82,9 +121,9 @@ class UserDetailResponse(UserResponse):
 # Category schemas
 class CategoryBase(BaseSchema):
     name: str = Field(..., min_length=1, max_length=100)
-    slug: str = Field(..., min_length=1, max_length=100, pattern=r"^[a-z0-9-]+$")
+    slug: Slug = Field(..., max_length=100)
     description: Optional[str] = Field(None, max_length=500)
-    color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
+    color: Optional[HexColor] = None
     is_active: bool = True
     parent_id: Optional[uuid.UUID] = None
 
@@ -95,9 +134,9 @@ class CategoryCreate(CategoryBase):
 
 class CategoryUpdate(BaseSchema):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
-    slug: Optional[str] = Field(None, min_length=1, max_length=100, pattern=r"^[a-z0-9-]+$")
+    slug: Optional[Slug] = Field(None, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
-    color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
+    color: Optional[HexColor] = None
     is_active: Optional[bool] = None
     parent_id: Optional[uuid.UUID] = None
 
@@ -122,9 +161,9 @@ class CategoryDetailResponse(CategoryResponse):
 # Tag schemas
 class TagBase(BaseSchema):
     name: str = Field(..., min_length=1, max_length=50)
-    slug: str = Field(..., min_length=1, max_length=50, pattern=r"^[a-z0-9-]+$")
+    slug: Slug = Field(..., max_length=50)
     description: Optional[str] = Field(None, max_length=200)
-    color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
+    color: Optional[HexColor] = None
 
 
 class TagCreate(TagBase):
@@ -133,9 +172,9 @@ class TagCreate(TagBase):
 
 class TagUpdate(BaseSchema):
     name: Optional[str] = Field(None, min_length=1, max_length=50)
-    slug: Optional[str] = Field(None, min_length=1, max_length=50, pattern=r"^[a-z0-9-]+$")
+    slug: Optional[Slug] = Field(None, max_length=50)
     description: Optional[str] = Field(None, max_length=200)
-    color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
+    color: Optional[HexColor] = None
 
 
 class TagResponse(TagBase):
@@ -146,9 +185,37 @@ class TagResponse(TagBase):
 
 
 # Post schemas
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+# Exactly the ASCII characters _SLUG_STRIP would remove, so ASCII names can
+# skip the regex pass in favour of a single bytes.translate.
+_SLUG_ASCII_STRIP = bytes(c for c in range(128) if _SLUG_STRIP.match(chr(c)))
+
+
+def generate_slug(name: str, limit: int) -> str:
+    """Generate a URL-friendly slug of at most ``limit`` characters"""
+    slug = name.lower()
+    if slug.isascii():
+        slug = slug.encode().translate(None, _SLUG_ASCII_STRIP).decode()
+    else:
+        slug = _SLUG_STRIP.sub("", slug)
+    # Collapse runs of whitespace and hyphens into single hyphens and trim
+    # them from both ends in one C-level split/join
+    return "-".join(slug.replace("-", " ").split())[:limit]
+
+
+def estimate_reading_time(content: str) -> int:
+    """Estimate reading time in minutes at 200 words per minute.
+
+    Words are approximated by counting separators, which avoids building the
+    list of words that ``len(content.split())`` would allocate.
+    """
+    word_count = content.count(" ") + content.count("\n") + 1
+    return max(1, word_count // 200)
+
+
 class PostBase(BaseSchema):
     title: str = Field(..., min_length=1, max_length=200)
-    slug: str = Field(..., min_length=1, max_length=200, pattern=r"^[a-z0-9-]+$")
+    slug: Slug = Field(..., max_length=200)
     excerpt: Optional[str] = Field(None, max_length=500)
     content: str = Field(..., min_length=10)
     featured_image: Optional[str] = Field(None, max_length=255)
@@ -159,6 +226,7 @@ class PostBase(BaseSchema):
 
 
 class PostCreate(PostBase):
+    slug: Optional[Slug] = Field(None, max_length=200)
     author_id: uuid.UUID
     category_ids: List[uuid.UUID] = Field(default_factory=list)
     tag_ids: List[uuid.UUID] = Field(default_factory=list)
@@ -169,18 +237,18 @@ class PostCreate(PostBase):
             raise ValueError("Post content must be at least 100 characters long")
         return v
 
-    @validator("reading_time", always=True)
-    def calculate_reading_time(cls, v, values):
-        if v is None and "content" in values:
-            # Estimate reading time: 200 words per minute
-            word_count = len(values["content"].split())
-            return max(1, word_count // 200)
-        return v
+    @model_validator(mode="after")
+    def derive_slug_and_reading_time(self) -> "PostCreate":
+        if not self.slug:
+            self.slug = generate_slug(self.title, 200)
+        if not self.reading_time:
+            self.reading_time = estimate_reading_time(self.content)
+        return self
 
 
 class PostUpdate(BaseSchema):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
-    slug: Optional[str] = Field(None, min_length=1, max_length=200, pattern=r"^[a-z0-9-]+$")
+    slug: Optional[Slug] = Field(None, max_length=200)
     excerpt: Optional[str] = Field(None, max_length=500)
     content: Optional[str] = Field(None, min_length=10)
     featured_image: Optional[str] = Field(None, max_length=255)
@@ -191,6 +259,15 @@ class PostUpdate(BaseSchema):
     category_ids: Optional[List[uuid.UUID]] = None
     tag_ids: Optional[List[uuid.UUID]] = None
 
+    @model_validator(mode="after")
+    def derive_slug_and_reading_time(self) -> "PostUpdate":
+        # Only follow fields that are part of this update
+        if self.title and not self.slug:
+            self.slug = generate_slug(self.title, 200)
+        if self.content and not self.reading_time:
+            self.reading_time = estimate_reading_time(self.content)
+        return self
+
 
 class PostResponse(PostBase):
     id: uuid.UUID
@@ -221,6 +298,15 @@ class PostDetailResponse(PostResponse):
     tags: List[TagResponse] = []
 
 
+class PostSummaryResponse(BaseSchema):
+    id: uuid.UUID
+    title: str
+    slug: str
+    status: PostStatus
+    view_count: int
+    created_at: datetime.datetime
+
+
 # Comment schemas
 class CommentBase(BaseSchema):
     content: str = Field(..., min_length=1, max_length=1000)
@@ -299,8 +385,3 @@ class BulkOperationResponse(BaseSchema):
     error_count: int
     errors: List[Dict[str, Any]] = []
 
-
-# Update forward references
-CategoryResponse.model_rebuild()
-CategoryDetailResponse.model_rebuild()
-CommentDetailResponse.model_rebuild()
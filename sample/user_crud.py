@@ -1,8 +1,8 @@
-import asyncio
 import uuid
 from typing import Dict, List
 
 from fastapi import Depends, HTTPException
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from auto_crud.core.crud.base import BaseCRUD
@@ -15,7 +15,7 @@ from auto_crud.core.schemas.pagination import (
 from auto_crud.dependencies.page_param import PageParams
 from sample.db import get_session
 from sample.hooks import UserHooks
-from sample.models import User
+from sample.models import User, user_followers
 from sample.schemas import (
     PostResponse,
     UserCreate,
@@ -26,31 +26,37 @@ from sample.schemas import (
 from .post_crud import post_crud
 
 
+_USER_SEARCH_FIELDS = ("username", "email", "full_name", "bio")
+_POST_SEARCH_FIELDS = ("title", "content")
+
+# Static filters shared across requests; list_objects never mutates them
+_VERIFIED_ACTIVE_FILTERS = [
+    FilterParam(field="is_verified", operator="eq", value=True),
+    FilterParam(field="is_active", operator="eq", value=True),
+]
+
+
 class UserRouterFactory(RouterFactory[User, uuid.UUID, UserCreate, UserUpdate]):
-    @action(method="GET", detail=False, url_path="verified")
-    async def get_verified_users(
-        self, session: AsyncSession = Depends(get_session)
-    ) -> List[UserResponse]:
+    @action(
+        method="GET", detail=False, url_path="verified", response_model=List[UserResponse]
+    )
+    async def get_verified_users(self, session: AsyncSession = Depends(get_session)) -> List[User]:
         """Get all verified users"""
-        filters = [
-            FilterParam(field="is_verified", operator="eq", value=True),
-            FilterParam(field="is_active", operator="eq", value=True),
-        ]
-        users = await self.crud.list_objects(session, filters=filters)
-        return [UserResponse.model_validate(user) for user in users]
+        return await self.crud.list_objects(session, filters=_VERIFIED_ACTIVE_FILTERS)
 
-    @action(method="POST", detail=True, url_path="verify", status_code=200)
+    @action(
+        method="POST", detail=True, url_path="verify", status_code=200, response_model=UserResponse
+    )
     async def verify_user(
         self, session: AsyncSession = Depends(get_session), *, id: uuid.UUID
-    ) -> UserResponse:
+    ) -> User:
         """Verify a user account"""
         user = await self.crud.get_by_id(session, id=id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
         update_data = {"is_verified": True}
-        updated_user = await self.crud.update(session, obj=user, obj_in=update_data)
-        return UserResponse.model_validate(updated_user)
+        return await self.crud.update(session, obj=user, obj_in=update_data)
 
     @action(
         method="GET", detail=True, url_path="posts", response_model=PaginatedResponse[PostResponse]
@@ -63,12 +69,15 @@ class UserRouterFactory(RouterFactory[User, uuid.UUID, UserCreate, UserUpdate]):
         page_params: PageParams = Depends(),
     ):
         """Get all posts by a user with pagination"""
-        filters = [*page_params.filters, FilterParam(field="author_id", operator="eq", value=id)]
+        filters = [
+            *page_params.filters,
+            FilterParam.model_construct(field="author_id", operator="eq", value=id),
+        ]
         return await post_crud.list_objects(
             session,
             filters=filters,
             search=page_params.search,
-            search_fields=["title", "content"],
+            search_fields=_POST_SEARCH_FIELDS,
             sorting=page_params.sort_by,
             pagination={
                 "page": page_params.page,
@@ -93,13 +102,16 @@ class UserRouterFactory(RouterFactory[User, uuid.UUID, UserCreate, UserUpdate]):
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
-        filters = [*page_params.filters, FilterParam(field="following.id", operator="eq", value=id)]
+        filters = [
+            *page_params.filters,
+            FilterParam.model_construct(field="following.id", operator="eq", value=id),
+        ]
 
         return await self.crud.list_objects(
             session,
             filters=filters,
             search=page_params.search,
-            search_fields=["username", "email", "full_name", "bio"],
+            search_fields=_USER_SEARCH_FIELDS,
             sorting=page_params.sort_by,
             pagination={
                 "page": page_params.page,
@@ -119,33 +131,43 @@ class UserRouterFactory(RouterFactory[User, uuid.UUID, UserCreate, UserUpdate]):
         if id == target_id:
             raise HTTPException(status_code=400, detail="Cannot follow yourself")
 
-        follower_task = self.crud.get_by_id(session, id, prefetch=["following"])
-        target_task = self.crud.get_by_id(session, target_id)
-
-        follower, target = await asyncio.gather(follower_task, target_task)
-
-        if not follower or not target:
+        # One round-trip answers all three checks without loading the
+        # follower's whole following collection
+        follower_exists, target_username, already_following = (
+            await session.execute(
+                select(
+                    exists().where(User.id == id),
+                    select(User.username).where(User.id == target_id).scalar_subquery(),
+                    exists().where(
+                        user_followers.c.follower_id == id,
+                        user_followers.c.following_id == target_id,
+                    ),
+                )
+            )
+        ).one()
+
+        if not follower_exists or target_username is None:
             raise HTTPException(status_code=404, detail="User not found")
 
-        if any(user.id == target.id for user in follower.following):
+        if already_following:
             raise HTTPException(status_code=400, detail="Already following this user")
 
-        follower.following.append(target)
-        session.add(follower)
+        await session.execute(
+            user_followers.insert().values(follower_id=id, following_id=target_id)
+        )
         await session.commit()
 
-        return {"message": f"Successfully followed {target.username}"}
+        return {"message": f"Successfully followed {target_username}"}
 
-    @action(method="GET", detail=False, url_path="search")
+    @action(method="GET", detail=False, url_path="search", response_model=List[UserResponse])
     async def search_users(
         self,
         session: AsyncSession = Depends(get_session),
         *,
         q: str,
-    ) -> List[UserResponse]:
+    ) -> List[User]:
         """Search users by username, email, or full name"""
-        users = await self.crud.search(session, q, fields=["username", "email", "full_name"])
-        return [UserResponse.model_validate(user) for user in users]
+        return await self.crud.search(session, q, fields=["username", "email", "full_name"])
 
 
 user_crud = BaseCRUD[User, uuid.UUID, UserCreate, UserUpdate](model=User, hooks=UserHooks())
@@ -1,7 +1,9 @@
 import asyncio
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Union
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -15,9 +17,15 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    event,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.pool import StaticPool
 
@@ -25,6 +33,11 @@ from auto_crud.core.crud.base import BaseCRUD, CRUDHooks
 from auto_crud.core.crud.filter import QueryFilter
 from auto_crud.core.crud.router import RouterFactory
 
+try:  # uvloop comes with uvicorn[standard] but has no Windows build
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 # Test Models
 class Base(DeclarativeBase):
@@ -153,12 +166,11 @@ class TestHooks(CRUDHooks[User, uuid.UUID, UserCreate, UserUpdate]):
 
 
 # Database setup
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_asyncio_loop_factories(config, item):
+    """Run the async tests on uvloop where it is installed."""
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
 
 
 @pytest.fixture(scope="session")
@@ -284,17 +296,16 @@ def category_router(session_factory, category_crud):
 @pytest.fixture
 def sample_users():
     """Create sample user data for testing."""
-    import random
 
     def unique_user(base):
-        suffix = random.randint(100000, 999999)
+        suffix = uuid.uuid4().hex[:8]
         return {
             "username": f"{base}_{suffix}",
             "email": f"{base}_{suffix}@example.com",
             "password": "password123",
             "full_name": base.replace("_", " ").title(),
             "bio": "Test bio",
-            "age": 25 + (suffix % 10),
+            "age": 25 + int(suffix, 16) % 10,
         }
 
     return [
@@ -307,17 +318,13 @@ def sample_users():
 @pytest.fixture
 def sample_posts():
     """Create sample post data for testing."""
-    import random
-    import time
-
-    timestamp = int(time.time() * 1000)
 
     def unique_post(base):
-        suffix = random.randint(1000, 9999)
+        suffix = uuid.uuid4().hex[:8]
         return {
-            "title": f"{base} {timestamp} {suffix}",
+            "title": f"{base} {suffix}",
             "content": f"This is the {base.lower()} content",
-            "status": "published" if suffix % 2 == 0 else "draft",
+            "status": "published" if int(suffix, 16) % 2 == 0 else "draft",
         }
 
     return [
@@ -330,16 +337,12 @@ def sample_posts():
 @pytest.fixture
 def sample_categories():
     """Create sample category data for testing."""
-    import random
-    import time
-
-    timestamp = int(time.time() * 1000)
 
     def unique_cat(base):
-        suffix = random.randint(1000, 9999)
+        suffix = uuid.uuid4().hex[:8]
         return {
-            "name": f"{base} {timestamp} {suffix}",
-            "slug": f"{base.lower().replace(' ', '-')}-{timestamp}-{suffix}",
+            "name": f"{base} {suffix}",
+            "slug": f"{base.lower().replace(' ', '-')}-{suffix}",
             "description": f"{base} related posts",
         }
 
@@ -350,6 +353,28 @@ def sample_categories():
     ]
 
 
+@pytest.fixture
+def user_factory(db_session):
+    """Insert ``User`` rows straight from column values, without a schema round-trip.
+
+    ``one(**overrides)`` adds a single user; ``many(specs)`` takes a count of
+    default users or a list of override dicts and inserts them in one flush.
+    """
+
+    async def one(**overrides) -> User:
+        return (await many([overrides]))[0]
+
+    async def many(specs: Union[int, List[Dict[str, Any]]]) -> List[User]:
+        if isinstance(specs, int):
+            specs = [{}] * specs
+        users = [User(**user_values(**spec)) for spec in specs]
+        db_session.add_all(users)
+        await db_session.flush()
+        return users
+
+    return SimpleNamespace(one=one, many=many)
+
+
 # FastAPI app fixture
 @pytest.fixture
 def app():
@@ -380,12 +405,30 @@ def mock_query_result():
 
 
 # Utility functions
-def create_test_user(**kwargs) -> UserCreate:
-    """Create a test user with default values."""
-    import random
-    import time
-    import uuid
+@contextmanager
+def capture_sql(engine: AsyncEngine) -> Iterator[List[str]]:
+    """Collect the SQL strings ``engine`` sends to the database inside the block."""
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
 
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def persist(session: AsyncSession, obj):
+    """Add ``obj`` and flush it so its primary key and defaults are populated."""
+    session.add(obj)
+    await session.flush()
+    return obj
+
+
+def user_values(**kwargs) -> Dict[str, Any]:
+    """Return column values for a test user, overridden by ``kwargs``."""
     # Use UUID for uniqueness to avoid collisions in fast test loops
     unique_id = uuid.uuid4().hex
     defaults = {
@@ -397,16 +440,31 @@ def create_test_user(**kwargs) -> UserCreate:
         "age": 25,
     }
     defaults.update(kwargs)
-    return UserCreate(**defaults)
+    return defaults
+
+
+def create_test_user(**kwargs) -> UserCreate:
+    """Create a test user with default values."""
+    return UserCreate(**user_values(**kwargs))
+
+
+def to_user(user_in: UserCreate, **overrides) -> User:
+    """Build an unsaved ``User`` from a create schema without a ``model_dump``."""
+    return User(
+        username=user_in.username,
+        email=user_in.email,
+        password=user_in.password,
+        full_name=user_in.full_name,
+        bio=user_in.bio,
+        age=user_in.age,
+        **overrides,
+    )
 
 
 def create_test_post(author_id: uuid.UUID, **kwargs) -> PostCreate:
     """Create a test post with default values."""
-    import time
-
-    timestamp = int(time.time() * 1000)  # Use timestamp for uniqueness
     defaults = {
-        "title": f"Test Post {timestamp}",
+        "title": f"Test Post {uuid.uuid4().hex[:8]}",
         "content": "Test content",
         "status": "draft",
         "author_id": author_id,
@@ -415,14 +473,23 @@ def create_test_post(author_id: uuid.UUID, **kwargs) -> PostCreate:
     return PostCreate(**defaults)
 
 
+def to_post(post_in: PostCreate, **overrides) -> Post:
+    """Build an unsaved ``Post`` from a create schema without a ``model_dump``."""
+    return Post(
+        title=post_in.title,
+        content=post_in.content,
+        status=post_in.status,
+        author_id=post_in.author_id,
+        **overrides,
+    )
+
+
 def create_test_category(**kwargs) -> CategoryCreate:
     """Create a test category with default values."""
-    import time
-
-    timestamp = int(time.time() * 1000)  # Use timestamp for uniqueness
+    suffix = uuid.uuid4().hex[:8]
     defaults = {
-        "name": f"Test Category {timestamp}",
-        "slug": f"test-category-{timestamp}",
+        "name": f"Test Category {suffix}",
+        "slug": f"test-category-{suffix}",
         "description": "Test description",
     }
     defaults.update(kwargs)
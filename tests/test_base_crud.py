@@ -1,24 +1,36 @@
 import uuid
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import IntegrityError, InvalidRequestError, StatementError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from auto_crud.core.crud.base import BaseCRUD, CRUDHooks
+from auto_crud.core.errors import FilterError, ValidationError
 from auto_crud.core.schemas.pagination import (
     FilterParam,
     Pagination,
 )
 from tests.conftest import (
-    Post,
     TestHooks,
     User,
     UserCreate,
     UserUpdate,
+    capture_sql,
     create_test_post,
     create_test_user,
+    persist,
+    to_post,
+    to_user,
+    user_values,
 )
 
+# Fixed ids for rows that must not exist yet; nothing else inserts these values.
+# Keep a letter in the hex: SQLite gives the UUID column numeric affinity, so an
+# all-digit value would be stored back as an integer.
+MISSING_ID = uuid.UUID("deadbeef-0000-4000-8000-000000000001")
+NEW_USER_ID = uuid.UUID("deadbeef-0000-4000-8000-000000000002")
+
 
 class TestBaseCRUD:
     """Test suite for BaseCRUD class."""
@@ -36,10 +48,8 @@ class TestBaseCRUD:
         """Test successful get_by_id operation."""
         # Create a user
         user_data = create_test_user()
-        user = User(**user_data.model_dump())
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data)
+        await persist(db_session, user)
 
         # Get user by ID
         retrieved_user = await user_crud.get_by_id(db_session, user.id)
@@ -52,42 +62,80 @@ class TestBaseCRUD:
     @pytest.mark.asyncio
     async def test_get_by_id_not_found(self, user_crud, db_session):
         """Test get_by_id with non-existent ID."""
-        non_existent_id = uuid.uuid4()
+        non_existent_id = MISSING_ID
         user = await user_crud.get_by_id(db_session, non_existent_id)
         assert user is None
 
     @pytest.mark.asyncio
-    async def test_get_by_id_with_include(self, user_crud, db_session):
+    async def test_get_by_id_uses_identity_map(self, user_crud, db_session):
+        """Test get_by_id returns objects already in the session without a query."""
+        user = to_user(create_test_user())
+        await persist(db_session, user)
+
+        statements = []
+
+        def record(orm_execute_state):
+            statements.append(orm_execute_state.statement)
+
+        event.listen(db_session.sync_session, "do_orm_execute", record)
+        try:
+            retrieved_user = await user_crud.get_by_id(db_session, user.id)
+        finally:
+            event.remove(db_session.sync_session, "do_orm_execute", record)
+
+        assert retrieved_user is user
+        assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_with_include(self, user_crud, db_session, async_engine):
         """Test get_by_id with include parameter."""
         # Create a user with posts
         user_data = create_test_user()
-        user = User(**user_data.model_dump())
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data, id=uuid.uuid4())
 
         # Create a post for the user
         post_data = create_test_post(user.id)
-        post = Post(**post_data.model_dump())
-        db_session.add(post)
-        await db_session.commit()
+        post = to_post(post_data)
+        db_session.add_all([user, post])
+        await db_session.flush()
 
         # Get user with posts included
-        retrieved_user = await user_crud.get_by_id(db_session, user.id, prefetch=["posts"])
+        with capture_sql(async_engine) as statements:
+            retrieved_user = await user_crud.get_by_id(db_session, user.id, prefetch=["posts"])
+            posts = retrieved_user.posts
 
         assert retrieved_user is not None
-        assert len(retrieved_user.posts) == 1
-        assert retrieved_user.posts[0].title == post.title
+        assert len(posts) == 1
+        assert posts[0].title == post.title
+        # The user row plus one IN-clause fetch for the posts
+        assert len(statements) <= 2
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_prefetch_uses_separate_select(
+        self, user_crud, db_session, async_engine
+    ):
+        """Test collection prefetch loads with its own SELECT instead of a JOIN."""
+        user = to_user(create_test_user(), id=uuid.uuid4())
+        db_session.add_all(
+            [user, *(to_post(create_test_post(user.id, title=f"Post {i}")) for i in range(3))]
+        )
+        await db_session.flush()
+        db_session.expunge_all()
+
+        with capture_sql(async_engine) as statements:
+            retrieved_user = await user_crud.get_by_id(db_session, user.id, prefetch=["posts"])
+
+        assert len(retrieved_user.posts) == 3
+        assert len(statements) == 2
+        assert "JOIN" not in statements[0].upper()
 
     @pytest.mark.asyncio
     async def test_get_one_success(self, user_crud, db_session):
         """Test successful get_one operation."""
         # Create a user
         user_data = create_test_user()
-        user = User(**user_data.model_dump())
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data)
+        await persist(db_session, user)
 
         # Get user by username
         filters = [FilterParam(field="username", operator="eq", value=user.username)]
@@ -147,10 +195,8 @@ class TestBaseCRUD:
         """Test successful update operation."""
         # Create a user
         user_data = create_test_user()
-        user = User(**user_data.model_dump())
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data)
+        await persist(db_session, user)
 
         # Update user
         update_data = UserUpdate(full_name="Updated Name", age=30)
@@ -166,10 +212,8 @@ class TestBaseCRUD:
         """Test update operation with dictionary input."""
         # Create a user
         user_data = create_test_user()
-        user = User(**user_data.model_dump())
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data)
+        await persist(db_session, user)
 
         # Update user with dict
         update_dict = {"full_name": "Dict Updated Name", "age": 35}
@@ -179,15 +223,28 @@ class TestBaseCRUD:
         assert updated_user.full_name == "Dict Updated Name"
         assert updated_user.age == 35
 
+    @pytest.mark.asyncio
+    async def test_update_skips_refresh_of_current_values(
+        self, user_crud, db_session, async_engine
+    ):
+        """Test update does not reload a row whose values were not expired."""
+        user = to_user(create_test_user())
+        await persist(db_session, user)
+
+        with capture_sql(async_engine) as statements:
+            updated_user = await user_crud.update(db_session, user, {"age": 26})
+
+        assert updated_user.age == 26
+        assert updated_user.updated_at is not None
+        assert not any(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+
     @pytest.mark.asyncio
     async def test_delete_success(self, user_crud, db_session):
         """Test successful delete operation."""
         # Create a user
         user_data = create_test_user()
-        user = User(**user_data.model_dump())
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data)
+        await persist(db_session, user)
 
         user_id = user.id
 
@@ -206,10 +263,8 @@ class TestBaseCRUD:
         """Test successful delete_by_id operation."""
         # Create a user
         user_data = create_test_user()
-        user = User(**user_data.model_dump())
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data)
+        await persist(db_session, user)
 
         user_id = user.id
 
@@ -225,14 +280,14 @@ class TestBaseCRUD:
     @pytest.mark.asyncio
     async def test_delete_by_id_not_found(self, user_crud, db_session):
         """Test delete_by_id with non-existent ID."""
-        non_existent_id = uuid.uuid4()
+        non_existent_id = MISSING_ID
         deleted_count = await user_crud.delete_by_id(db_session, non_existent_id)
         assert deleted_count == 0
 
     @pytest.mark.asyncio
     async def test_get_or_create_new(self, user_crud, db_session):
         """Test get_or_create with new user."""
-        user_id = uuid.uuid4()
+        user_id = NEW_USER_ID
         defaults = {
             "username": "newuser",
             "email": "new@example.com",
@@ -251,10 +306,8 @@ class TestBaseCRUD:
         """Test get_or_create with existing user."""
         # Create a user
         user_data = create_test_user()
-        user = User(**user_data.model_dump())
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data)
+        await persist(db_session, user)
 
         defaults = {"username": "different", "email": "different@example.com"}
 
@@ -266,19 +319,16 @@ class TestBaseCRUD:
         assert retrieved_user.username == user.username  # Original username
 
     @pytest.mark.asyncio
-    async def test_search_success(self, user_crud, db_session):
+    async def test_search_success(self, user_crud, db_session, user_factory):
         """Test successful search operation."""
         # Create users with different names
-        users_data = [
-            create_test_user(username="john_doe"),
-            create_test_user(username="jane_smith"),
-            create_test_user(username="bob_wilson"),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
+        await user_factory.many(
+            [
+                {"username": "john_doe"},
+                {"username": "jane_smith"},
+                {"username": "bob_wilson"},
+            ]
+        )
 
         # Search for users with "john" in username
         results = await user_crud.search(db_session, "john", fields=["username"])
@@ -287,43 +337,42 @@ class TestBaseCRUD:
         assert "john" in results[0].username.lower()
 
     @pytest.mark.asyncio
-    async def test_search_with_relations(self, user_crud: BaseCRUD, db_session: AsyncSession):
+    async def test_search_with_relations(
+        self, user_crud: BaseCRUD, db_session: AsyncSession, async_engine
+    ):
         """Test search operation with relations."""
         # Create a user with posts
         user_data = create_test_user(username="testuser_unique")
-        user = User(**user_data.model_dump())
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data, id=uuid.uuid4())
 
         # Create a post
         post_data = create_test_post(user.id, title="Test Post")
-        post = Post(**post_data.model_dump())
-        db_session.add(post)
-        await db_session.commit()
+        post = to_post(post_data)
+        db_session.add_all([user, post])
+        await db_session.flush()
 
         # Search with relations
-        results = await user_crud.search(
-            db_session, "testuser_unique", fields=["username"], prefetch=["posts"]
-        )
+        with capture_sql(async_engine) as statements:
+            results = await user_crud.search(
+                db_session, "testuser_unique", fields=["username"], prefetch=["posts"]
+            )
+            posts = [result.posts for result in results]
 
         assert len(results) == 1
-        assert len(results[0].posts) == 1
+        assert len(posts[0]) == 1
+        assert len(statements) <= 2
 
     @pytest.mark.asyncio
-    async def test_count_success(self, user_crud, db_session):
+    async def test_count_success(self, user_crud, db_session, user_factory):
         """Test successful count operation."""
         # Create multiple users
-        users_data = [
-            create_test_user(username="count1_unique"),
-            create_test_user(username="count2_unique"),
-            create_test_user(username="count3_unique"),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
+        await user_factory.many(
+            [
+                {"username": "count1_unique"},
+                {"username": "count2_unique"},
+                {"username": "count3_unique"},
+            ]
+        )
 
         # Count users with specific usernames
         filters = [
@@ -337,19 +386,10 @@ class TestBaseCRUD:
         assert count == 3
 
     @pytest.mark.asyncio
-    async def test_count_with_filters(self, user_crud, db_session):
+    async def test_count_with_filters(self, user_crud, db_session, user_factory):
         """Test count operation with filters."""
         # Create users with different ages
-        users_data = [
-            create_test_user(),
-            create_test_user(),
-            create_test_user(),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
+        await user_factory.many(3)
 
         # Count users with age >= 30
         filters = [FilterParam(field="age", operator="ge", value=30)]
@@ -361,10 +401,8 @@ class TestBaseCRUD:
         """Test successful exists operation."""
         # Create a user
         user_data = create_test_user()
-        user = User(**user_data.model_dump())
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data)
+        await persist(db_session, user)
 
         # Check if user exists
         exists = await user_crud.exists(db_session, user.id)
@@ -373,90 +411,48 @@ class TestBaseCRUD:
     @pytest.mark.asyncio
     async def test_exists_not_found(self, user_crud, db_session):
         """Test exists operation with non-existent ID."""
-        non_existent_id = uuid.uuid4()
+        non_existent_id = MISSING_ID
         exists = await user_crud.exists(db_session, non_existent_id)
         assert exists is False
 
     @pytest.mark.asyncio
-    async def test_bulk_create_success(self, user_crud, db_session):
-        """Test successful bulk_create operation."""
+    @pytest.mark.parametrize("payload", [UserCreate, dict], ids=["schemas", "dicts"])
+    async def test_bulk_create_success(self, user_crud, db_session, payload):
+        """Test bulk_create accepts both create schemas and plain dictionaries."""
+        prefix = f"bulk_{payload.__name__.lower()}"
         users_data = [
-            create_test_user(username="bulk1"),
-            create_test_user(username="bulk2"),
-            create_test_user(username="bulk3"),
+            payload(**user_values(username=f"{prefix}{i}_{uuid.uuid4().hex[:8]}"))
+            for i in range(3)
         ]
 
         created_users = await user_crud.bulk_create(db_session, users_data)
 
         assert len(created_users) == 3
-        assert all("bulk" in user.username for user in created_users)
+        assert all(user.username.startswith(prefix) for user in created_users)
 
     @pytest.mark.asyncio
-    async def test_bulk_create_with_dicts(self, user_crud, db_session):
-        """Test bulk_create operation with dictionaries."""
-        users_dicts = [
-            {
-                "username": "dict1",
-                "email": "dict1@example.com",
-                "password": "password123",
-            },
-            {
-                "username": "dict2",
-                "email": "dict2@example.com",
-                "password": "password456",
-            },
-        ]
-
-        created_users = await user_crud.bulk_create(db_session, users_dicts)
-
-        assert len(created_users) == 2
-        assert all(user.username.startswith("dict") for user in created_users)
-
-    @pytest.mark.asyncio
-    async def test_bulk_update_success(self, user_crud, db_session):
+    async def test_bulk_update_success(self, user_crud, db_session, user_factory):
         """Test successful bulk_update operation."""
         # Create users
-        users_data = [
-            create_test_user(username="update1"),
-            create_test_user(username="update2"),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
-
-        # Get created users
-        result = await db_session.execute(select(User).where(User.username.like("update%")))
-        users = result.scalars().all()
+        users = await user_factory.many([{"username": "update1"}, {"username": "update2"}])
 
         # Prepare updates
-        updates = [
-            {"id": users[0].id, "full_name": "Updated 1"},
-            {"id": users[1].id, "full_name": "Updated 2"},
-        ]
+        updates = [{"id": user.id, "full_name": f"Updated {i}"} for i, user in enumerate(users, 1)]
 
         updated_count = await user_crud.bulk_update(db_session, updates)
         assert updated_count == 2
 
     @pytest.mark.asyncio
-    async def test_bulk_delete_success(self, user_crud, db_session):
+    async def test_bulk_delete_success(self, user_crud, db_session, user_factory):
         """Test successful bulk_delete operation."""
         # Create users
-        users_data = [
-            create_test_user(username="delete1"),
-            create_test_user(username="delete2"),
-            create_test_user(username="delete3"),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
-
-        # Get created users
-        result = await db_session.execute(select(User).where(User.username.like("delete%")))
-        users = result.scalars().all()
+        users = await user_factory.many(
+            [
+                {"username": "delete1"},
+                {"username": "delete2"},
+                {"username": "delete3"},
+            ]
+        )
         user_ids = [user.id for user in users]
 
         # Delete users
@@ -464,23 +460,22 @@ class TestBaseCRUD:
         assert deleted_count == 3
 
         # Verify users are deleted
-        result = await db_session.execute(select(User).where(User.id.in_(user_ids)))
-        assert len(result.scalars().all()) == 0
+        remaining = await db_session.scalar(
+            select(func.count()).select_from(User).where(User.id.in_(user_ids))
+        )
+        assert remaining == 0
 
     @pytest.mark.asyncio
-    async def test_get_multi_success(self, user_crud, db_session):
+    async def test_get_multi_success(self, user_crud, db_session, user_factory):
         """Test successful get_multi operation."""
         # Create users
-        users_data = [
-            create_test_user(username="multi1_unique"),
-            create_test_user(username="multi2_unique"),
-            create_test_user(username="multi3_unique"),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
+        await user_factory.many(
+            [
+                {"username": "multi1_unique"},
+                {"username": "multi2_unique"},
+                {"username": "multi3_unique"},
+            ]
+        )
 
         # Get users with specific usernames
         filters = [
@@ -494,19 +489,10 @@ class TestBaseCRUD:
         assert len(users) == 3
 
     @pytest.mark.asyncio
-    async def test_get_multi_with_filters(self, user_crud, db_session):
+    async def test_get_multi_with_filters(self, user_crud, db_session, user_factory):
         """Test get_multi operation with filters."""
         # Create users with different ages
-        users_data = [
-            create_test_user(),
-            create_test_user(),
-            create_test_user(),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
+        await user_factory.many(3)
 
         # Get users with age >= 30
         filters = [FilterParam(field="age", operator="ge", value=30)]
@@ -515,19 +501,16 @@ class TestBaseCRUD:
         assert all(user.age >= 30 for user in users)
 
     @pytest.mark.asyncio
-    async def test_get_multi_with_search(self, user_crud, db_session):
+    async def test_get_multi_with_search(self, user_crud, db_session, user_factory):
         """Test get_multi operation with search."""
         # Create users
-        users_data = [
-            create_test_user(username="search1"),
-            create_test_user(username="search2"),
-            create_test_user(username="other"),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
+        await user_factory.many(
+            [
+                {"username": "search1"},
+                {"username": "search2"},
+                {"username": "other"},
+            ]
+        )
 
         # Search for users with "search" in username
         users = await user_crud.list_objects(
@@ -537,19 +520,16 @@ class TestBaseCRUD:
         assert all("search" in user.username for user in users)
 
     @pytest.mark.asyncio
-    async def test_get_multi_with_sorting(self, user_crud, db_session):
+    async def test_get_multi_with_sorting(self, user_crud, db_session, user_factory):
         """Test get_multi operation with sorting."""
         # Create users with different ages
-        users_data = [
-            create_test_user(username="sort1_unique", age=25),
-            create_test_user(username="sort2_unique", age=30),
-            create_test_user(username="sort3_unique", age=35),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
+        await user_factory.many(
+            [
+                {"username": "sort1_unique", "age": 25},
+                {"username": "sort2_unique", "age": 30},
+                {"username": "sort3_unique", "age": 35},
+            ]
+        )
 
         # Sort by age ascending for specific users
         filters = [
@@ -565,21 +545,20 @@ class TestBaseCRUD:
         assert users[0].age <= users[1].age <= users[2].age
 
     @pytest.mark.asyncio
-    async def test_apply_pagination_success(self, user_crud, db_session):
+    async def test_apply_pagination_success(
+        self, user_crud, db_session, user_factory, async_engine
+    ):
         """Test successful apply_pagination operation."""
         # Create users
-        users_data = [
-            create_test_user(username="page1_unique"),
-            create_test_user(username="page2_unique"),
-            create_test_user(username="page3_unique"),
-            create_test_user(username="page4_unique"),
-            create_test_user(username="page5_unique"),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
+        await user_factory.many(
+            [
+                {"username": "page1_unique"},
+                {"username": "page2_unique"},
+                {"username": "page3_unique"},
+                {"username": "page4_unique"},
+                {"username": "page5_unique"},
+            ]
+        )
 
         # Test pagination with specific filter
         query = select(User).where(
@@ -589,7 +568,8 @@ class TestBaseCRUD:
         )
         pagination = Pagination(page=1, size=2)
 
-        result = await user_crud.apply_pagination(db_session, query, pagination)
+        with capture_sql(async_engine) as statements:
+            result = await user_crud.apply_pagination(db_session, query, pagination)
 
         assert result.total == 5
         assert result.page == 1
@@ -598,24 +578,37 @@ class TestBaseCRUD:
         assert result.has_next is True
         assert result.has_prev is False
         assert len(result.items) == 2
+        # The total comes from a window column on the page query itself
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_apply_pagination_past_last_page(self, user_crud, db_session, user_factory):
+        """Test a page past the end still reports the total."""
+        users = await user_factory.many(3)
+
+        query = select(User).where(User.id.in_([user.id for user in users]))
+        result = await user_crud.apply_pagination(db_session, query, Pagination(page=5, size=2))
+
+        assert result.items == []
+        assert result.total == 3
+        assert result.pages == 2
+        assert result.has_next is False
+        assert result.has_prev is True
 
     @pytest.mark.asyncio
     async def test_apply_pagination_with_filters(
-        self, user_crud: BaseCRUD, db_session: AsyncSession
+        self, user_crud: BaseCRUD, db_session: AsyncSession, user_factory
     ):
         """Test apply_pagination operation with filters."""
         # Create users with different ages
-        users_data = [
-            create_test_user(username="filter1_unique", age=25),
-            create_test_user(username="filter2_unique", age=30),
-            create_test_user(username="filter3_unique", age=35),
-            create_test_user(username="filter4_unique", age=40),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
+        await user_factory.many(
+            [
+                {"username": "filter1_unique", "age": 25},
+                {"username": "filter2_unique", "age": 30},
+                {"username": "filter3_unique", "age": 35},
+                {"username": "filter4_unique", "age": 40},
+            ]
+        )
 
         # Test pagination with age filter for specific users
         query = select(User).where(
@@ -636,20 +629,17 @@ class TestBaseCRUD:
 
     @pytest.mark.asyncio
     async def test_apply_pagination_with_search(
-        self, user_crud: BaseCRUD, db_session: AsyncSession
+        self, user_crud: BaseCRUD, db_session: AsyncSession, user_factory
     ):
         """Test apply_pagination operation with search."""
         # Create users
-        users_data = [
-            create_test_user(username="search1_unique"),
-            create_test_user(username="search2_unique"),
-            create_test_user(username="other_unique"),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
+        await user_factory.many(
+            [
+                {"username": "search1_unique"},
+                {"username": "search2_unique"},
+                {"username": "other_unique"},
+            ]
+        )
 
         search = "search"
         search_fields = ["username"]
@@ -678,19 +668,16 @@ class TestBaseCRUD:
         assert all("search" in user.username for user in result.items)
 
     @pytest.mark.asyncio
-    async def test_get_multi_paginated_success(self, user_crud, db_session):
+    async def test_get_multi_paginated_success(self, user_crud, db_session, user_factory):
         """Test successful get_multi_paginated operation."""
         # Create users
-        users_data = [
-            create_test_user(username="paginated1_unique"),
-            create_test_user(username="paginated2_unique"),
-            create_test_user(username="paginated3_unique"),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
+        await user_factory.many(
+            [
+                {"username": "paginated1_unique"},
+                {"username": "paginated2_unique"},
+                {"username": "paginated3_unique"},
+            ]
+        )
 
         # Test paginated retrieval with specific filter
         pagination = Pagination(page=1, size=2)
@@ -713,19 +700,16 @@ class TestBaseCRUD:
         assert len(result.items) == 2
 
     @pytest.mark.asyncio
-    async def test_get_multi_paginated_with_filters(self, user_crud, db_session):
+    async def test_get_multi_paginated_with_filters(self, user_crud, db_session, user_factory):
         """Test get_multi_paginated operation with filters."""
         # Create users with different ages
-        users_data = [
-            create_test_user(username="filtered1_unique", age=25),
-            create_test_user(username="filtered2_unique", age=30),
-            create_test_user(username="filtered3_unique", age=35),
-        ]
-
-        for user_data in users_data:
-            user = User(**user_data.model_dump())
-            db_session.add(user)
-        await db_session.commit()
+        await user_factory.many(
+            [
+                {"username": "filtered1_unique", "age": 25},
+                {"username": "filtered2_unique", "age": 30},
+                {"username": "filtered3_unique", "age": 35},
+            ]
+        )
 
         # Test paginated retrieval with filters for specific users
         pagination = Pagination(page=1, size=10)
@@ -754,32 +738,83 @@ class TestBaseCRUD:
         assert category_crud.pk == ["id"]
 
     @pytest.mark.asyncio
-    async def test_apply_prefetch(self, user_crud, db_session):
+    async def test_apply_prefetch(self, user_crud, db_session, async_engine):
         """Test _apply_prefetch method."""
         # Create a user with posts
         user_data = create_test_user(username="include_test")
-        user = User(**user_data.model_dump())
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data, id=uuid.uuid4())
 
         # Create a post
         post_data = create_test_post(user.id)
-        post = Post(**post_data.model_dump())
-        db_session.add(post)
-        await db_session.commit()
+        post = to_post(post_data)
+        db_session.add_all([user, post])
+        await db_session.flush()
 
         # Test applying prefetch
         query = select(User).where(User.username == "include_test")
         query_with_prefetch = user_crud._apply_prefetch(query, ["posts"])
 
         # Execute query
-        result = await db_session.execute(query_with_prefetch)
-        user_with_posts = result.scalar_one()
+        with capture_sql(async_engine) as statements:
+            result = await db_session.execute(query_with_prefetch)
+            user_with_posts = result.scalar_one()
+            posts = user_with_posts.posts
 
         assert user_with_posts is not None
-        assert len(user_with_posts.posts) == 1
-        assert user_with_posts.posts[0].title == post.title
+        assert len(posts) == 1
+        assert posts[0].title == post.title
+        assert len(statements) <= 2
+
+    @pytest.mark.asyncio
+    async def test_list_objects_strict_loading(self, async_session_maker):
+        """Test strict loading makes relations outside prefetch raise."""
+        strict_crud = BaseCRUD[User, uuid.UUID, UserCreate, UserUpdate](
+            model=User, strict_loading=True
+        )
+        async with async_session_maker() as session:
+            user = to_user(create_test_user(), id=uuid.uuid4())
+            session.add_all([user, to_post(create_test_post(user.id))])
+            await session.commit()
+            user_id = user.id
+
+        filters = [FilterParam(field="id", operator="eq", value=user_id)]
+        async with async_session_maker() as session:
+            users = await strict_crud.list_objects(session, filters=filters)
+            with pytest.raises(InvalidRequestError, match="lazy='raise"):
+                users[0].posts
+
+        async with async_session_maker() as session:
+            users = await strict_crud.list_objects(session, filters=filters, prefetch=["posts"])
+            assert len(users[0].posts) == 1
+
+    def test_strict_loading_from_environment(self, monkeypatch):
+        """Test strict loading defaults to the CRUD_STRICT_LOADING variable."""
+        monkeypatch.setenv("CRUD_STRICT_LOADING", "1")
+        assert BaseCRUD(User).strict_loading is True
+        assert BaseCRUD(User, strict_loading=False).strict_loading is False
+
+        monkeypatch.delenv("CRUD_STRICT_LOADING")
+        assert BaseCRUD(User).strict_loading is False
+
+    def test_apply_prefetch_caches_loaders(self, user_crud, monkeypatch):
+        """Test loader options are built once per prefetch list."""
+        calls = []
+        build = user_crud._build_relation_loaders
+
+        def counting_build(relations):
+            calls.append(relations)
+            return build(relations)
+
+        monkeypatch.setattr(user_crud, "_build_relation_loaders", counting_build)
+        first = user_crud._apply_prefetch(select(User), ["posts"])
+        second = user_crud._apply_prefetch(select(User), ["posts"])
+
+        assert len(calls) == 1
+        assert first._with_options == second._with_options
+
+        with pytest.raises(ValidationError):
+            user_crud._apply_prefetch(select(User), ["missing"])
+        assert ("missing",) not in user_crud._loader_cache
 
     @pytest.mark.asyncio
     async def test_get_model_relations(self, user_crud):
@@ -829,15 +864,47 @@ class TestCRUDHooks:
         # Check that post_create hook set is_verified to True
         assert created_user.is_verified is True
 
+    @pytest.mark.asyncio
+    async def test_post_create_hook_runs_in_transaction(
+        self, user_crud_with_hooks, db_session, async_session_maker
+    ):
+        """Test post_create changes are committed together with the object."""
+        created_user = await user_crud_with_hooks.create(db_session, create_test_user())
+
+        async with async_session_maker() as other_session:
+            stored = await other_session.get(User, created_user.id)
+            assert stored is not None
+            assert stored.is_verified is True
+
+    @pytest.mark.asyncio
+    async def test_post_create_hook_failure_skips_commit(self, db_session, async_session_maker):
+        """Test an error in post_create leaves the object uncommitted."""
+
+        class FailingHooks(CRUDHooks[User, uuid.UUID, UserCreate, UserUpdate]):
+            async def post_create(self, db_session: AsyncSession, obj: User, *args, **kwargs):
+                assert obj.id is not None  # flushed before the hook runs
+                raise RuntimeError("hook failed")
+
+        crud = BaseCRUD[User, uuid.UUID, UserCreate, UserUpdate](model=User, hooks=FailingHooks())
+        user_data = create_test_user()
+
+        with pytest.raises(RuntimeError):
+            await crud.create(db_session, user_data)
+        await db_session.rollback()
+
+        async with async_session_maker() as other_session:
+            result = await other_session.execute(
+                select(User).where(User.username == user_data.username)
+            )
+            assert result.scalar_one_or_none() is None
+
     @pytest.mark.asyncio
     async def test_pre_delete_hook_allow(self, user_crud_with_hooks, db_session):
         """Test pre_delete hook allowing deletion."""
         # Create an inactive user
         user_data = create_test_user()
-        user = User(**user_data.model_dump(), is_active=False)
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data, is_active=False)
+        await persist(db_session, user)
 
         # Delete should succeed for inactive user
         deleted_user = await user_crud_with_hooks.delete(db_session, user)
@@ -848,13 +915,11 @@ class TestCRUDHooks:
         """Test pre_delete hook preventing deletion."""
         # Create an active user
         user_data = create_test_user()
-        user = User(**user_data.model_dump(), is_active=True)
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        user = to_user(user_data, is_active=True)
+        await persist(db_session, user)
 
         # Delete should fail for active user
-        with pytest.raises(Exception):  # The exact exception depends on implementation
+        with pytest.raises(ValidationError):
             await user_crud_with_hooks.delete(db_session, user)
 
     @pytest.mark.asyncio
@@ -892,30 +957,28 @@ class TestBaseCRUDEdgeCases:
         # Test with missing required fields
         invalid_data = {"username": "test"}  # Missing email and password
 
-        with pytest.raises(Exception):  # Should raise validation error
+        with pytest.raises(IntegrityError):  # NOT NULL constraint on email/password
             await user_crud.create(db_session, invalid_data)
 
     @pytest.mark.asyncio
     async def test_get_by_id_with_invalid_id_type(self, user_crud, db_session):
         """Test get_by_id with invalid ID type."""
         # Test with string ID instead of UUID
-        with pytest.raises(Exception):  # Should raise type error
+        with pytest.raises(StatementError):  # UUID bind processing fails
             await user_crud.get_by_id(db_session, "invalid-id")
 
     @pytest.mark.asyncio
-    async def test_bulk_operations_with_empty_lists(self, user_crud, db_session):
-        """Test bulk operations with empty lists."""
-        # Test bulk_create with empty list
-        created_users = await user_crud.bulk_create(db_session, [])
-        assert len(created_users) == 0
+    async def test_bulk_operations_with_empty_lists(self, user_crud, db_session, async_engine):
+        """Test bulk operations with empty lists return without touching the database."""
+        with capture_sql(async_engine) as statements:
+            created_users = await user_crud.bulk_create(db_session, [])
+            updated_count = await user_crud.bulk_update(db_session, [])
+            deleted_count = await user_crud.bulk_delete(db_session, [])
 
-        # Test bulk_update with empty list
-        updated_count = await user_crud.bulk_update(db_session, [])
+        assert len(created_users) == 0
         assert updated_count == 0
-
-        # Test bulk_delete with empty list
-        deleted_count = await user_crud.bulk_delete(db_session, [])
         assert deleted_count == 0
+        assert statements == []
 
     @pytest.mark.asyncio
     async def test_pagination_edge_cases(self, user_crud, db_session):
@@ -941,9 +1004,8 @@ class TestBaseCRUDEdgeCases:
         """Test search with empty search fields."""
         # Create a user
         user_data = create_test_user(username="empty_search_test_unique")
-        user = User(**user_data.model_dump())
-        db_session.add(user)
-        await db_session.commit()
+        user = to_user(user_data)
+        await persist(db_session, user)
 
         # Search with empty fields list
         results = await user_crud.search(db_session, "empty_search_test_unique", fields=[])
@@ -957,5 +1019,5 @@ class TestBaseCRUDEdgeCases:
         # Test with non-existent field
         filters = [FilterParam(field="non_existent_field", operator="eq", value="test")]
 
-        with pytest.raises(Exception):  # Should raise filter error
+        with pytest.raises(FilterError):
             await user_crud.list_objects(db_session, filters=filters)
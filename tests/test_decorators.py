@@ -1,8 +1,15 @@
+import inspect
 from enum import Enum
 
+import pytest
+
 from auto_crud.core.crud.decorators import ActionMetadata, action
 
 
+def _kwarg_function():
+    return "kwarg_value"
+
+
 class TestActionMetadata:
     """Test suite for ActionMetadata class."""
 
@@ -122,79 +129,25 @@ class TestActionDecorator:
         metadata = test_function._action_metadata
         assert metadata.tags == [TestTags.TEST, TestTags.CUSTOM]
 
-    def test_action_decorator_status_code_defaults(self):
-        """Test action decorator status code defaults."""
-
-        # GET method
-        @action(method="GET")
-        def get_function():
-            pass
-
-        assert get_function._action_metadata.status_code == 200
-
-        # POST method
-        @action(method="POST")
-        def post_function():
-            pass
-
-        assert post_function._action_metadata.status_code == 201
-
-        # PUT method
-        @action(method="PUT")
-        def put_function():
-            pass
-
-        assert put_function._action_metadata.status_code == 200
-
-        # PATCH method
-        @action(method="PATCH")
-        def patch_function():
-            pass
-
-        assert patch_function._action_metadata.status_code == 200
-
-        # DELETE method
-        @action(method="DELETE")
-        def delete_function():
-            pass
-
-        assert delete_function._action_metadata.status_code == 204
-
-    def test_action_decorator_with_custom_status_code(self):
-        """Test action decorator with custom status code."""
-
-        @action(method="GET", status_code=202)
-        def test_function():
-            return "test"
-
-        assert test_function._action_metadata.status_code == 202
-
-    def test_action_decorator_with_none_status_code(self):
-        """Test action decorator with None status code (should use default)."""
-
-        @action(method="POST", status_code=None)
-        def test_function():
-            return "test"
-
-        assert test_function._action_metadata.status_code == 201
-
-    def test_action_decorator_with_none_dependencies(self):
-        """Test action decorator with None dependencies."""
-
-        @action(method="GET", dependencies=None)
-        def test_function():
-            return "test"
-
-        assert test_function._action_metadata.dependencies == []
-
-    def test_action_decorator_with_none_tags(self):
-        """Test action decorator with None tags."""
+    @pytest.mark.parametrize(
+        "method, status_code, expected",
+        [
+            ("GET", None, 200),
+            ("POST", None, 201),
+            ("PUT", None, 200),
+            ("PATCH", None, 200),
+            ("DELETE", None, 204),
+            ("GET", 202, 202),
+        ],
+    )
+    def test_action_decorator_status_code(self, method, status_code, expected):
+        """Test action decorator status codes, falling back to the method default."""
 
-        @action(method="GET", tags=None)
+        @action(method=method, status_code=status_code)
         def test_function():
             return "test"
 
-        assert test_function._action_metadata.tags is None
+        assert test_function._action_metadata.status_code == expected
 
     def test_action_decorator_function_preservation(self):
         """Test that the decorator preserves the original function."""
@@ -330,246 +283,92 @@ class TestActionDecorator:
     def test_action_decorator_function_signature_preservation(self):
         """Test that the decorator preserves function signature."""
 
-        @action(method="GET")
         def test_function(param1: str, param2: int = 10, *, kwarg1: bool = True):
             return f"{param1}_{param2}_{kwarg1}"
 
-        # Check that the function signature is preserved
-        import inspect
+        original_sig = inspect.signature(test_function)
+        decorated = action(method="GET")(test_function)
 
-        sig = inspect.signature(test_function)
-        params = list(sig.parameters.keys())
+        # The decorator returns the function itself rather than a wrapper, so
+        # signature inspection (e.g. by FastAPI) has no __wrapped__ chain to follow
+        assert decorated is test_function
+        assert not hasattr(decorated, "__wrapped__")
 
-        assert "param1" in params
-        assert "param2" in params
-        assert "kwarg1" in params
+        sig = inspect.signature(decorated)
+        assert sig == original_sig
+        assert list(sig.parameters) == ["param1", "param2", "kwarg1"]
 
 
 class TestActionDecoratorEdgeCases:
     """Test suite for action decorator edge cases."""
 
-    def test_action_decorator_with_empty_dependencies(self):
-        """Test action decorator with empty dependencies list."""
-
-        @action(method="GET", dependencies=[])
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.dependencies == []
-
-    def test_action_decorator_with_empty_tags(self):
-        """Test action decorator with empty tags list."""
-
-        @action(method="GET", tags=[])
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.tags == []
-
-    def test_action_decorator_with_empty_url_path(self):
-        """Test action decorator with empty URL path."""
-
-        @action(method="GET", url_path="")
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.url_path == ""
-
-    def test_action_decorator_with_none_url_path(self):
-        """Test action decorator with None URL path."""
-
-        @action(method="GET", url_path=None)
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.url_path is None
-
-    def test_action_decorator_with_none_response_model(self):
-        """Test action decorator with None response model."""
-
-        @action(method="GET", response_model=None)
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.response_model is None
-
-    def test_action_decorator_with_none_summary(self):
-        """Test action decorator with None summary."""
-
-        @action(method="GET", summary=None)
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.summary is None
-
-    def test_action_decorator_with_none_description(self):
-        """Test action decorator with None description."""
-
-        @action(method="GET", description=None)
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.description is None
-
-    def test_action_decorator_with_false_response_model_by_alias(self):
-        """Test action decorator with response_model_by_alias=False."""
-
-        @action(method="GET", response_model_by_alias=False)
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.response_model_by_alias is False
-
-    def test_action_decorator_with_false_deprecated(self):
-        """Test action decorator with deprecated=False."""
-
-        @action(method="GET", deprecated=False)
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.deprecated is False
-
-    def test_action_decorator_with_false_detail(self):
-        """Test action decorator with detail=False."""
-
-        @action(method="GET", detail=False)
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.detail is False
-
-    def test_action_decorator_with_zero_status_code(self):
-        """Test action decorator with status_code=0."""
-
-        @action(method="GET", status_code=0)
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.status_code == 0
-
-    def test_action_decorator_with_negative_status_code(self):
-        """Test action decorator with negative status code."""
-
-        @action(method="GET", status_code=-1)
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.status_code == -1
-
-    def test_action_decorator_with_large_status_code(self):
-        """Test action decorator with large status code."""
-
-        @action(method="GET", status_code=999)
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.status_code == 999
-
-    def test_action_decorator_with_complex_kwargs(self):
-        """Test action decorator with complex kwargs."""
-        complex_obj = {"nested": {"value": 123}}
-
-        @action(
-            method="GET",
-            complex_kwarg=complex_obj,
-            list_kwarg=[1, 2, 3],
-            tuple_kwarg=(1, 2, 3),
-        )
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.kwargs["complex_kwarg"] == complex_obj
-        assert metadata.kwargs["list_kwarg"] == [1, 2, 3]
-        assert metadata.kwargs["tuple_kwarg"] == (1, 2, 3)
-
-    def test_action_decorator_with_function_as_kwarg(self):
-        """Test action decorator with function as kwarg."""
-
-        def kwarg_function():
-            return "kwarg_value"
-
-        @action(
-            method="GET",
-            function_kwarg=kwarg_function,
-        )
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.kwargs["function_kwarg"] == kwarg_function
-
-    def test_action_decorator_with_none_kwargs(self):
-        """Test action decorator with None as kwarg."""
-
-        @action(
-            method="GET",
-            none_kwarg=None,
-        )
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.kwargs["none_kwarg"] is None
-
-    def test_action_decorator_with_boolean_kwargs(self):
-        """Test action decorator with boolean kwargs."""
-
-        @action(
-            method="GET",
-            true_kwarg=True,
-            false_kwarg=False,
-        )
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.kwargs["true_kwarg"] is True
-        assert metadata.kwargs["false_kwarg"] is False
-
-    def test_action_decorator_with_numeric_kwargs(self):
-        """Test action decorator with numeric kwargs."""
-
-        @action(
-            method="GET",
-            int_kwarg=123,
-            float_kwarg=123.456,
-            negative_kwarg=-123,
-        )
-        def test_function():
-            return "test"
-
-        metadata = test_function._action_metadata
-        assert metadata.kwargs["int_kwarg"] == 123
-        assert metadata.kwargs["float_kwarg"] == 123.456
-        assert metadata.kwargs["negative_kwarg"] == -123
-
-    def test_action_decorator_with_string_kwargs(self):
-        """Test action decorator with string kwargs."""
-
-        @action(
-            method="GET",
-            empty_string_kwarg="",
-            normal_string_kwarg="test",
-            special_chars_kwarg="!@#$%^&*()",
-        )
+    @pytest.mark.parametrize(
+        "option, value, expected",
+        [
+            ("dependencies", None, []),
+            ("dependencies", [], []),
+            ("tags", None, None),
+            ("tags", [], []),
+            ("url_path", "", ""),
+            ("url_path", None, None),
+            ("response_model", None, None),
+            ("summary", None, None),
+            ("description", None, None),
+            ("response_model_by_alias", False, False),
+            ("deprecated", False, False),
+            ("detail", False, False),
+            ("status_code", 0, 0),
+            ("status_code", -1, -1),
+            ("status_code", 999, 999),
+        ],
+    )
+    def test_action_decorator_option_edge_values(self, option, value, expected):
+        """Test empty, None, False and unusual option values reach the metadata."""
+
+        @action(method="GET", **{option: value})
+        def test_function():
+            return "test"
+
+        actual = getattr(test_function._action_metadata, option)
+        assert actual == expected
+        assert type(actual) is type(expected)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param(
+                {
+                    "complex_kwarg": {"nested": {"value": 123}},
+                    "list_kwarg": [1, 2, 3],
+                    "tuple_kwarg": (1, 2, 3),
+                },
+                id="complex",
+            ),
+            pytest.param({"function_kwarg": _kwarg_function}, id="function"),
+            pytest.param({"none_kwarg": None}, id="none"),
+            pytest.param({"true_kwarg": True, "false_kwarg": False}, id="boolean"),
+            pytest.param(
+                {"int_kwarg": 123, "float_kwarg": 123.456, "negative_kwarg": -123},
+                id="numeric",
+            ),
+            pytest.param(
+                {
+                    "empty_string_kwarg": "",
+                    "normal_string_kwarg": "test",
+                    "special_chars_kwarg": "!@#$%^&*()",
+                },
+                id="string",
+            ),
+        ],
+    )
+    def test_action_decorator_kwargs_passthrough(self, kwargs):
+        """Test arbitrary kwargs reach the metadata unchanged."""
+
+        @action(method="GET", **kwargs)
         def test_function():
             return "test"
 
         metadata = test_function._action_metadata
-        assert metadata.kwargs["empty_string_kwarg"] == ""
-        assert metadata.kwargs["normal_string_kwarg"] == "test"
-        assert metadata.kwargs["special_chars_kwarg"] == "!@#$%^&*()"
+        passed = {key: metadata.kwargs[key] for key in kwargs}
+        assert passed == kwargs
+        assert all(type(passed[key]) is type(value) for key, value in kwargs.items())
@@ -741,3 +741,29 @@ class TestQueryFilterCustomization:
         assert query_filter.model == CustomModel
         assert query_filter._validate_operator_for_field("name", "eq") is True
         assert query_filter._validate_operator_for_field("value", "gt") is True
+
+    @pytest.mark.asyncio
+    async def test_search_on_tsvector_column(self):
+        """Test search uses a full-text match for tsvector fields."""
+
+        from sqlalchemy import Integer, String
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.dialects.postgresql import TSVECTOR
+        from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+        class SearchBase(DeclarativeBase):
+            pass
+
+        class Article(SearchBase):
+            __tablename__ = "articles"
+
+            id: Mapped[int] = mapped_column(Integer, primary_key=True)
+            title: Mapped[str] = mapped_column(String(100))
+            search_vector = mapped_column(TSVECTOR)
+
+        query_filter = QueryFilter(Article)
+        query = query_filter.apply_search(select(Article), "fast api", ["title", "search_vector"])
+        sql = str(query.compile(dialect=postgresql.dialect()))
+
+        assert "articles.search_vector @@ plainto_tsquery(" in sql
+        assert "articles.title ILIKE" in sql
@@ -5,7 +5,7 @@ from typing import Dict, Literal, Type
 import pytest
 from fastapi.testclient import TestClient
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from auto_crud.core.crud.base import BaseCRUD
 from auto_crud.core.crud.router import RouterFactory
@@ -287,8 +287,10 @@ class TestRouterFactory:
         # Delete users
         _ = await user_router.perform_bulk_delete(db_session, user_ids)
 
-        result = await db_session.execute(select(User).where(User.id.in_(user_ids)))
-        assert len(result.scalars().all()) == 0
+        remaining = await db_session.scalar(
+            select(func.count()).select_from(User).where(User.id.in_(user_ids))
+        )
+        assert remaining == 0
 
     @pytest.mark.asyncio
     async def test_generate_response_schema(self, user_router: RouterFactory):
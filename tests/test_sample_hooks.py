@@ -0,0 +1,97 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from sample.models import Base, Post, User
+from sample.post_crud import comment_crud, like_crud
+from sample.schemas import CommentCreate, LikeCreate
+
+
+@pytest_asyncio.fixture
+async def sample_session():
+    """Create a session on a fresh in-memory database with the sample schema."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_maker() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def sample_post(sample_session):
+    """Create a post plus a second user who can like and comment on it."""
+    author = User(username="author", email="author@example.com", password="x")
+    fan = User(username="fan", email="fan@example.com", password="x")
+    sample_session.add_all([author, fan])
+    await sample_session.flush()
+    post = Post(title="Post", slug="post", content="content", author_id=author.id)
+    sample_session.add(post)
+    await sample_session.commit()
+    return post, fan
+
+
+@contextmanager
+def count_commits(session: AsyncSession) -> Iterator[List[None]]:
+    """Record one entry per commit of ``session``, including no-op commits."""
+    commits: List[None] = []
+    sync_session = session.sync_session
+
+    def on_commit(sess):
+        commits.append(None)
+
+    event.listen(sync_session, "after_commit", on_commit)
+    try:
+        yield commits
+    finally:
+        event.remove(sync_session, "after_commit", on_commit)
+
+
+class TestLikeHooks:
+    """Test suite for the sample LikeHooks."""
+
+    @pytest.mark.asyncio
+    async def test_like_count_follows_likes(self, sample_session, sample_post):
+        """Test creating and deleting a like updates Post.like_count."""
+        post, fan = sample_post
+
+        like = await like_crud.create(sample_session, LikeCreate(user_id=fan.id, post_id=post.id))
+        await sample_session.refresh(post)
+        assert post.like_count == 1
+
+        await like_crud.delete(sample_session, like)
+        await sample_session.refresh(post)
+        assert post.like_count == 0
+
+
+class TestCommentHooks:
+    """Test suite for the sample CommentHooks."""
+
+    @pytest.mark.asyncio
+    async def test_comment_count_committed_with_comment(self, sample_session, sample_post):
+        """Test the comment and its Post.comment_count change share one commit."""
+        post, fan = sample_post
+        comment_in = CommentCreate(content="Nice post", post_id=post.id, author_id=fan.id)
+
+        with count_commits(sample_session) as commits:
+            comment = await comment_crud.create(sample_session, comment_in)
+        assert len(commits) == 1
+        await sample_session.refresh(post)
+        assert post.comment_count == 1
+
+        with count_commits(sample_session) as commits:
+            await comment_crud.delete(sample_session, comment)
+        assert len(commits) == 1
+        await sample_session.refresh(post)
+        assert post.comment_count == 0